@@ -0,0 +1,56 @@
+"""
+Shared pytest fixtures for the arbitrage betting scraper tests.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+
+async def _yield_once(delay: float = 0, result=None):
+    """Stand-in for the handlers' sleep that yields to the event loop once without waiting."""
+    return await asyncio.sleep(0, result)
+
+
+@pytest.fixture(autouse=True)
+def _skip_handler_sleeps(monkeypatch):
+    """Skip the timeout waits and settle delays of instruction handlers during a test."""
+    # Only patch when the test imported the handlers, so tests without Playwright still run
+    handlers = sys.modules.get("scraper.instruction_handlers")
+    if handlers is not None:
+        monkeypatch.setattr(handlers, "_sleep", _yield_once)
+
+
+@pytest.fixture(scope="session")
+def _test_db_engine():
+    """In-memory test database with the schema created once per session."""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
+    from database.models import Base
+
+    # One shared connection, so every test sees the same in-memory database
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # pysqlite defers BEGIN on its own; emit it explicitly so test_db's outer
+    # transaction is real and the session's savepoints nest inside it
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        """Turn off the driver's own transaction handling."""
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        """Start the transaction SQLAlchemy asked for."""
+        connection.exec_driver_sql("BEGIN")
+
+    # Fresh database, so skip the per-table existence checks
+    Base.metadata.create_all(engine, checkfirst=False)
+
+    yield engine
+
+    engine.dispose()
@@ -31,6 +31,9 @@ class DatabaseConfig:
         self.pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "3600"))
         self.echo = os.getenv("DB_ECHO", "false").lower() == "true"
 
+        # Rows per multi-row INSERT when executing bulk inserts
+        self.insert_page_size = int(os.getenv("DB_INSERT_PAGE_SIZE", "1000"))
+
     @property
     def database_url(self) -> str:
         """Generate database URL for SQLAlchemy."""
@@ -111,6 +114,7 @@ class DatabaseManager:
                     pool_timeout=self.config.pool_timeout,
                     pool_recycle=self.config.pool_recycle,
                     echo=self.config.echo,
+                    insertmanyvalues_page_size=self.config.insert_page_size,
                     future=True,
                     connect_args={
                         "sslmode": "prefer",
@@ -62,6 +62,19 @@ def setup_logging(verbose: bool = False, log_file: Optional[str] = None):
     )
 
 
+def setup_event_loop():
+    """Use uvloop for asyncio when it is installed, otherwise keep the default loop."""
+    if sys.platform == 'win32':
+        return  # Playwright needs the default Proactor loop on Windows
+
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.option('--log-file', help='Log file path')
@@ -71,6 +84,7 @@ def cli(ctx, verbose, log_file):
     ctx.ensure_object(dict)
     ctx.obj['verbose'] = verbose
     setup_logging(verbose, log_file)
+    setup_event_loop()
 
 
 @cli.command()
@@ -118,7 +132,10 @@ def run(ctx, config_file, dry_run, output, no_database):
 
             # Run the scraper
             runner = ScraperRunner()
-            result = runner.run_scraper_sync(config)
+            try:
+                result = runner.run_scraper_sync(config)
+            finally:
+                runner.close()
 
         # Display results
         _display_results(result)
@@ -345,32 +362,35 @@ def batch(config_dir, parallel, output_dir):
 
     console.print(f"[blue]Found {len(config_files)} configuration files[/blue]")
 
-    # Run scrapers
-    with Progress(console=console) as progress:
-        task = progress.add_task("Running batch scrapers...", total=len(config_files))
+    # Run scrapers sequentially (parallel execution would need asyncio coordination);
+    # one runner so the event loop and keep-alive connections carry over between configs
+    runner = ScraperRunner()
+    try:
+        with Progress(console=console) as progress:
+            task = progress.add_task("Running batch scrapers...", total=len(config_files))
 
-        # For now, run sequentially (parallel execution would need asyncio coordination)
-        for config_file in config_files:
-            try:
-                progress.update(task, description=f"Running {config_file.name}...")
+            for config_file in config_files:
+                try:
+                    progress.update(task, description=f"Running {config_file.name}...")
 
-                # Load config
-                config = ConfigLoader.load_from_yaml(str(config_file))
+                    # Load config
+                    config = ConfigLoader.load_from_yaml(str(config_file))
 
-                # Run scraper
-                runner = ScraperRunner()
-                result = runner.run_scraper_sync(config)
+                    # Run scraper
+                    result = runner.run_scraper_sync(config)
 
-                # Save results
-                result_file = output_path / f"{config_file.stem}_result.json"
-                _save_results(result, str(result_file))
+                    # Save results
+                    result_file = output_path / f"{config_file.stem}_result.json"
+                    _save_results(result, str(result_file))
 
-                console.print(f"[green]✓[/green] {config_file.name} completed")
+                    console.print(f"[green]✓[/green] {config_file.name} completed")
 
-            except Exception as e:
-                console.print(f"[red]✗[/red] {config_file.name} failed: {e}")
+                except Exception as e:
+                    console.print(f"[red]✗[/red] {config_file.name} failed: {e}")
 
-            progress.advance(task)
+                progress.advance(task)
+    finally:
+        runner.close()
 
     console.print(f"[blue]Batch processing complete. Results saved to {output_dir}[/blue]")
 
@@ -1,3 +1,5 @@
+import functools
+import os
 from typing import Dict, List, Optional, Union, Any, Literal
 from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
@@ -38,6 +40,7 @@ class ClickInstruction(BaseModel):
     wait_after: Optional[WaitCondition] = None
     optional: bool = Field(False, description="Don't fail if element not found")
     all_matching: bool = Field(False, description="Click all elements matching selector")
+    native_click: bool = Field(True, description="With all_matching, use real Playwright clicks; false clicks in-page with element.click() (CSS selectors only)")
 
 
 class WaitInstruction(BaseModel):
@@ -99,6 +102,7 @@ class InputInstruction(BaseModel):
     selector: str = Field(..., description="Input field selector")
     value: str = Field(..., description="Text to input")
     clear_first: bool = Field(True, description="Clear field before input")
+    simulate_typing: bool = Field(False, description="Type character by character instead of filling the value")
 
 
 class SelectInstruction(BaseModel):
@@ -162,6 +166,9 @@ class FetcherConfig(BaseModel):
     body: Optional[Dict[str, Any]] = None
     auth: Optional[Dict[str, str]] = None
 
+    # Connection warm-up
+    warm_hosts: List[str] = Field([], description="Hosts to pre-connect to (DNS + TLS) when the fetcher starts")
+
 
 class DatabaseConfig(BaseModel):
     """Simplified database configuration - only bookmaker and category info.
@@ -171,6 +178,7 @@ class DatabaseConfig(BaseModel):
     """
     bookmaker_name: str = Field(..., description="Bookmaker name for categorization")
     category_name: str = Field("General", description="Event category name")
+    max_concurrent_writes: int = Field(8, ge=1, description="Parallel transactions when saving events one by one")
 
 
 class MetaConfig(BaseModel):
@@ -178,6 +186,7 @@ class MetaConfig(BaseModel):
     name: str = Field(..., description="Scraper name")
     description: Optional[str] = None
     start_url: str = Field(..., description="Starting URL")
+    start_urls: List[str] = Field([], description="Additional URLs fetched together with start_url (API scrapers)")
     allowed_domains: List[str] = Field([], description="Allowed domains for navigation")
 
 
@@ -221,6 +230,12 @@ IfInstruction.model_rebuild()
 CollectInstruction.model_rebuild()
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(file_path: str, mtime_ns: int) -> 'ScraperConfig':
+    """Parsed config per (path, mtime); a changed file gets a new entry."""
+    return ConfigLoader.load_from_yaml(file_path)
+
+
 class ConfigLoader:
     """Configuration loader with validation."""
 
@@ -234,11 +249,26 @@ class ConfigLoader:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
+        # libyaml's C parser when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         with open(config_path, 'r', encoding='utf-8') as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=loader)
 
         return ScraperConfig(**raw_config)
 
+    @staticmethod
+    def load_cached(file_path: str) -> ScraperConfig:
+        """Load configuration from YAML file, reusing the parse while the file is unchanged."""
+        path = os.path.abspath(file_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+
+        # Deep copy, since callers are free to mutate the returned config
+        return _load_yaml_cached(path, mtime_ns).model_copy(deep=True)
+
     @staticmethod
     def load_from_dict(config_dict: Dict[str, Any]) -> ScraperConfig:
         """Load configuration from dictionary."""
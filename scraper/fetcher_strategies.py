@@ -4,34 +4,66 @@ Each strategy handles different types of content fetching.
 """
 
 import asyncio
+import json
 import logging
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 import requests
+from requests.adapters import HTTPAdapter
 from playwright.async_api import async_playwright, Page, Browser
 from urllib.parse import urljoin, urlparse
 
 from .config_schema import FetcherConfig, FetcherType
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so except clauses cover both
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson turns integers beyond 64 bits (e.g. 77-digit CLOB token ids) into floats;
+# only text with a run this long can hold one
+_LONG_DIGITS_RE = re.compile(r'\d{20}')
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text with orjson, or with the stdlib parser when large integers must stay exact."""
+    if orjson is None or _LONG_DIGITS_RE.search(text):
+        return json.loads(text)
+    return orjson.loads(text)
+
+# Parametrised so the script body stays constant and selectors are never
+# interpolated into JavaScript source
+ELEMENT_COUNT_AT_LEAST_JS = "([selector, count]) => document.querySelectorAll(selector).length >= count"
+
 
 class FetchResult:
     """Result container for fetch operations."""
 
     def __init__(self, content: str, url: str, status_code: int = 200,
-                 headers: Optional[Dict[str, str]] = None, metadata: Optional[Dict[str, Any]] = None):
+                 headers: Optional[Dict[str, str]] = None, metadata: Optional[Dict[str, Any]] = None,
+                 content_length: Optional[int] = None, json_data: Any = None):
         self.content = content
         self.url = url
         self.status_code = status_code
         self.headers = headers or {}
         self.metadata = metadata or {}
+        # Body size in bytes, when the fetcher knows it without measuring content
+        self.content_length = content_length
+        # Parsed JSON body, when the fetcher already decoded it
+        self.json_data = json_data
         self.timestamp = asyncio.get_event_loop().time()
 
 
 class FetcherStrategy(ABC):
     """Abstract base class for fetching strategies."""
 
+    # Whether fetch() may run concurrently on one fetcher instance
+    supports_concurrent_fetch = False
+
     def __init__(self, config: FetcherConfig):
         self.config = config
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
@@ -41,6 +73,12 @@ class FetcherStrategy(ABC):
         """Fetch content from the given URL."""
         pass
 
+    async def fetch_many(self, urls: List[str], **kwargs) -> List[FetchResult]:
+        """Fetch several URLs, concurrently when the fetcher supports it; results are in URL order."""
+        if self.supports_concurrent_fetch:
+            return list(await asyncio.gather(*(self.fetch(url, **kwargs) for url in urls)))
+        return [await self.fetch(url, **kwargs) for url in urls]
+
     @abstractmethod
     async def cleanup(self):
         """Clean up resources."""
@@ -58,12 +96,60 @@ class FetcherStrategy(ABC):
                    for allowed in allowed_domains)
 
 
+async def _warm_session_hosts(session: requests.Session, hosts: List[str], timeout: float) -> None:
+    """Open pooled connections to hosts ahead of time so DNS and TLS are already paid."""
+    def head(host: str):
+        url = host if '://' in host else f"https://{host}"
+        return session.head(url, allow_redirects=False, timeout=timeout)
+
+    results = await asyncio.gather(*(asyncio.to_thread(head, host) for host in hosts), return_exceptions=True)
+    for host, outcome in zip(hosts, results):
+        if isinstance(outcome, Exception):
+            logger.debug(f"Connection warm-up failed for {host}: {outcome}")
+
+
+def _mount_shared_adapter(session: requests.Session, http_adapter: Optional[HTTPAdapter]) -> None:
+    """Route the session through a connection pool shared with other fetchers."""
+    if http_adapter is not None:
+        session.mount('https://', http_adapter)
+        session.mount('http://', http_adapter)
+
+
+def _close_session(session: requests.Session, http_adapter: Optional[HTTPAdapter]) -> None:
+    """Close the session, leaving a shared adapter's pooled connections open."""
+    if http_adapter is not None:
+        for prefix, adapter in list(session.adapters.items()):
+            if adapter is http_adapter:
+                del session.adapters[prefix]
+    session.close()
+
+
+def _schedule_warm_up(session: requests.Session, config: FetcherConfig) -> Optional[asyncio.Task]:
+    """Schedule connection warm-up on the running event loop, if there is one."""
+    if not config.warm_hosts:
+        return None
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    return loop.create_task(_warm_session_hosts(session, config.warm_hosts, config.timeout_ms / 1000))
+
+
 class StaticFetcher(FetcherStrategy):
     """Static HTTP fetcher using requests."""
 
-    def __init__(self, config: FetcherConfig):
+    # Accepts a shared HTTPAdapter from FetcherFactory.create
+    uses_http_adapter = True
+    # Requests run in worker threads over a thread-safe connection pool
+    supports_concurrent_fetch = True
+
+    def __init__(self, config: FetcherConfig, http_adapter: Optional[HTTPAdapter] = None):
         super().__init__(config)
         self.session = requests.Session()
+        self._http_adapter = http_adapter
+        _mount_shared_adapter(self.session, http_adapter)
 
         # Set up headers
         default_headers = {
@@ -72,6 +158,8 @@ class StaticFetcher(FetcherStrategy):
         default_headers.update(config.headers)
         self.session.headers.update(default_headers)
 
+        self._warm_task = _schedule_warm_up(self.session, config)
+
     async def fetch(self, url: str, **kwargs) -> FetchResult:
         """Fetch content using HTTP requests."""
         self.logger.info(f"Fetching static content from: {url}")
@@ -80,7 +168,8 @@ class StaticFetcher(FetcherStrategy):
             method = kwargs.get('method', self.config.method or 'GET')
             timeout = kwargs.get('timeout', self.config.timeout_ms / 1000)
 
-            response = self.session.request(
+            response = await asyncio.to_thread(
+                self.session.request,
                 method=method,
                 url=url,
                 timeout=timeout,
@@ -88,14 +177,17 @@ class StaticFetcher(FetcherStrategy):
             )
             response.raise_for_status()
 
-            self.logger.debug(f"Successfully fetched {url} ({len(response.text)} bytes)")
+            # Response.text decodes the body on every access
+            content = response.text
+            self.logger.debug(f"Successfully fetched {url} ({len(response.content)} bytes)")
 
             return FetchResult(
-                content=response.text,
+                content=content,
                 url=response.url,
                 status_code=response.status_code,
                 headers=dict(response.headers),
-                metadata={'method': method, 'final_url': response.url}
+                metadata={'method': method, 'final_url': response.url},
+                content_length=len(response.content)
             )
 
         except requests.RequestException as e:
@@ -104,7 +196,9 @@ class StaticFetcher(FetcherStrategy):
 
     async def cleanup(self):
         """Close the session."""
-        self.session.close()
+        if self._warm_task and not self._warm_task.done():
+            self._warm_task.cancel()
+        _close_session(self.session, self._http_adapter)
 
 
 class BrowserFetcher(FetcherStrategy):
@@ -139,6 +233,24 @@ class BrowserFetcher(FetcherStrategy):
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
 
+            if self.config.warm_hosts:
+                await self._warm_hosts(self.config.warm_hosts)
+
+    async def _warm_hosts(self, hosts: List[str]):
+        """Pre-connect the browser context to hosts on throwaway pages."""
+        async def warm(host: str):
+            url = host if '://' in host else f"https://{host}"
+            page = await self.context.new_page()
+            try:
+                await page.goto(url, wait_until='commit', timeout=self.config.timeout_ms)
+            finally:
+                await page.close()
+
+        results = await asyncio.gather(*(warm(host) for host in hosts), return_exceptions=True)
+        for host, outcome in zip(hosts, results):
+            if isinstance(outcome, Exception):
+                self.logger.debug(f"Browser warm-up failed for {host}: {outcome}")
+
     async def fetch(self, url: str, **kwargs) -> FetchResult:
         """Fetch content using browser."""
         self.logger.info(f"Fetching browser content from: {url}")
@@ -178,6 +290,30 @@ class BrowserFetcher(FetcherStrategy):
         finally:
             await page.close()
 
+    async def fetch_many(self, urls: List[str], concurrency: int = 8, **kwargs) -> List[FetchResult]:
+        """
+        Fetch several URLs concurrently on separate pages of the shared context.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum number of pages open at the same time
+            **kwargs: Passed through to fetch() (e.g. wait_condition)
+
+        Returns:
+            FetchResults in URL order; the first failing fetch raises, as with FetcherStrategy.fetch_many
+        """
+        await self._ensure_browser()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_one(url: str) -> FetchResult:
+            async with semaphore:
+                # Always use a fresh page per URL, even for subclasses that
+                # override fetch() to reuse a single session page
+                return await BrowserFetcher.fetch(self, url, **kwargs)
+
+        self.logger.info(f"Fetching {len(urls)} URLs with concurrency {concurrency}")
+        return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
     async def _handle_wait_condition(self, page: Page, condition: Dict[str, Any]):
         """Handle wait conditions."""
         condition_type = condition.get('type', 'timeout')
@@ -188,13 +324,14 @@ class BrowserFetcher(FetcherStrategy):
         elif condition_type == 'selector':
             await page.wait_for_selector(condition['value'], timeout=timeout)
         elif condition_type == 'url_contains':
-            await page.wait_for_url(f"**/*{condition['value']}*", timeout=timeout)
+            await page.wait_for_url(re.compile(re.escape(condition['value'])), timeout=timeout)
         elif condition_type == 'element_count':
             # Wait for specific number of elements
             selector = condition.get('selector', 'body')
             count = condition.get('value', 1)
             await page.wait_for_function(
-                f"document.querySelectorAll('{selector}').length >= {count}",
+                ELEMENT_COUNT_AT_LEAST_JS,
+                arg=[selector, count],
                 timeout=timeout
             )
 
@@ -208,13 +345,19 @@ class BrowserFetcher(FetcherStrategy):
             await self._playwright.stop()
 
 
-class APIFetcher:
+class APIFetcher(FetcherStrategy):
     """Enhanced API-specific fetcher with better JSON handling."""
 
-    def __init__(self, config: FetcherConfig):
-        self.config = config
+    # Accepts a shared HTTPAdapter from FetcherFactory.create
+    uses_http_adapter = True
+    # Requests run in worker threads over a thread-safe connection pool
+    supports_concurrent_fetch = True
+
+    def __init__(self, config: FetcherConfig, http_adapter: Optional[HTTPAdapter] = None):
+        super().__init__(config)
         self.session = requests.Session()
-        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self._http_adapter = http_adapter
+        _mount_shared_adapter(self.session, http_adapter)
 
         # Set up headers for API
         default_headers = {
@@ -235,6 +378,8 @@ class APIFetcher:
                 key_header = config.auth.get('header', 'X-API-Key')
                 self.session.headers[key_header] = config.auth['key']
 
+        self._warm_task = _schedule_warm_up(self.session, config)
+
     async def fetch(self, url: str, **kwargs) -> FetchResult:
         """Fetch content from API endpoint with better error handling."""
         self.logger.info(f"Fetching API content from: {url}")
@@ -256,12 +401,12 @@ class APIFetcher:
             self.logger.debug(f"Making {method} request to {url}")
             self.logger.debug(f"Headers: {dict(self.session.headers)}")
 
-            response = self.session.request(method, url, **request_kwargs)
+            response = await asyncio.to_thread(self.session.request, method, url, **request_kwargs)
 
             # Log response details
             self.logger.debug(f"Response status: {response.status_code}")
             self.logger.debug(f"Response headers: {dict(response.headers)}")
-            self.logger.debug(f"Response content length: {len(response.text)}")
+            self.logger.debug(f"Response content length: {len(response.content)}")
 
             response.raise_for_status()
 
@@ -294,8 +439,7 @@ class APIFetcher:
 
             # Test JSON parsing to catch issues early
             try:
-                import json
-                parsed_data = json.loads(content_str)
+                parsed_data = _json_loads(content_str)
                 self.logger.debug(f"JSON parsing test successful. Data type: {type(parsed_data)}")
                 if isinstance(parsed_data, list):
                     self.logger.debug(f"JSON array with {len(parsed_data)} items")
@@ -322,7 +466,9 @@ class APIFetcher:
                     'method': method,
                     'content_type': response.headers.get('content-type'),
                     'encoding': response.encoding
-                }
+                },
+                content_length=len(response.content),
+                json_data=parsed_data
             )
 
         except requests.RequestException as e:
@@ -336,7 +482,9 @@ class APIFetcher:
 
     async def cleanup(self):
         """Close the session."""
-        self.session.close()
+        if self._warm_task and not self._warm_task.done():
+            self._warm_task.cancel()
+        _close_session(self.session, self._http_adapter)
 
 
 class InteractiveFetcher(BrowserFetcher):
@@ -412,13 +560,15 @@ class FetcherFactory:
     }
 
     @classmethod
-    def create(cls, config: FetcherConfig) -> FetcherStrategy:
-        """Create a fetcher instance based on configuration."""
+    def create(cls, config: FetcherConfig, http_adapter: Optional[HTTPAdapter] = None) -> FetcherStrategy:
+        """Create a fetcher instance based on configuration, optionally on a shared connection pool."""
         strategy_class = cls._strategies.get(config.type)
 
         if not strategy_class:
             raise ValueError(f"Unsupported fetcher type: {config.type}")
 
+        if http_adapter is not None and getattr(strategy_class, 'uses_http_adapter', False):
+            return strategy_class(config, http_adapter=http_adapter)
         return strategy_class(config)
 
     @classmethod
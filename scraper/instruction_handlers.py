@@ -4,9 +4,11 @@ Each handler executes specific instruction types.
 """
 
 import asyncio
+import functools
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from typing import Awaitable, Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from .config_schema import (
@@ -17,23 +19,171 @@ from .config_schema import (
 
 logger = logging.getLogger(__name__)
 
+# Finds every element matching a selector, clicks the visible ones in-page and
+# returns [matched, clicked] - one protocol round-trip for the whole batch.
+# Opt-in only (native_click: false): CSS selectors only, and the clicks are
+# synthetic element.click() events without scrolling into view
+CLICK_ALL_VISIBLE_JS = """
+(selector) => {
+    const elements = document.querySelectorAll(selector);
+    let clicked = 0;
+    for (const el of elements) {
+        const rect = el.getBoundingClientRect();
+        const style = getComputedStyle(el);
+        if (rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none') {
+            el.click();
+            clicked++;
+        }
+    }
+    return [elements.length, clicked];
+}
+"""
+
+# Walks containers -> items -> fields in-page and returns the extracted rows,
+# replacing one query_selector/text_content round-trip per field per item.
+# Selectors starting with '//' or 'xpath=' are resolved as XPath, like Playwright does.
+COLLECT_ITEMS_JS = """
+(args) => {
+    const isXPath = (s) => s.startsWith('//') || s.startsWith('xpath=');
+    const xpathOf = (s) => s.startsWith('xpath=') ? s.slice(6) : s;
+    const queryAll = (root, s) => {
+        if (!isXPath(s)) return Array.from(root.querySelectorAll(s));
+        const snapshot = document.evaluate(xpathOf(s), root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    };
+    const query = (root, s) => {
+        if (!isXPath(s)) return root.querySelector(s);
+        return document.evaluate(xpathOf(s), root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    };
+
+    const {container_selector, item_selector, fields, limit} = args;
+    const rows = [];
+    for (const container of queryAll(document, container_selector)) {
+        for (const item of queryAll(container, item_selector)) {
+            if (limit && rows.length >= limit) return rows;
+            const row = {};
+            for (const [name, field] of Object.entries(fields)) {
+                let target = null;
+                for (const s of field.selectors) {
+                    try { target = query(item, s); } catch (e) { target = null; }
+                    if (target) break;
+                }
+                if (!target) {
+                    row[name] = field.default;
+                    continue;
+                }
+                const raw = field.attribute === 'text' ? target.textContent : target.getAttribute(field.attribute);
+                row[name] = (raw || '').trim();
+            }
+            rows.push(row);
+        }
+    }
+    return rows;
+}
+"""
+
+# Selectors only Playwright's engine understands (engine prefixes, quoted text, '>>' chains,
+# Playwright pseudo-classes); COLLECT_ITEMS_JS handles plain CSS and '//' / 'xpath=' XPath only
+_PLAYWRIGHT_ONLY_SELECTOR_RE = re.compile(
+    r'^(?!xpath=)[a-z][\w-]*=|^["\'(]|^\.\.|>>'
+    r'|:(?:has-text|text|visible|nth-match|near|left-of|right-of|above|below)\b'
+)
+
+# Text of the first element matching a selector, used as a page-change sentinel
+FIRST_TEXT_JS = "(selector) => { const el = document.querySelector(selector); return el ? el.innerText : null; }"
+
+# Resolves once the sentinel element's text differs from the text seen before navigation
+TEXT_CHANGED_JS = """
+([selector, previous]) => {
+    const el = document.querySelector(selector);
+    return (el ? el.innerText : null) !== previous;
+}
+"""
+
+# Value and text of every option of a dropdown in one pass
+DROPDOWN_OPTIONS_JS = """
+(selector) => Array.from(document.querySelectorAll(selector + ' option')).map(
+    (option) => ({value: option.value, text: option.textContent})
+)
+"""
+
+# Vertical scroll by a pixel delta; the delta is an argument so the script text never changes
+SCROLL_BY_JS = "(delta) => window.scrollBy(0, delta)"
+
+# Sleep used for timeout waits and settle delays; tests replace it to skip the waiting
+_sleep = asyncio.sleep
+
+# How long to wait for pagination to settle before falling back to a short sleep
+PAGE_CHANGE_TIMEOUT_MS = 5000
+
+WaitResolver = Callable[[Page], Awaitable[bool]]
+
+
+# Keyed on the condition's fields rather than the object, so copies of a config
+# share resolvers and the cache stays bounded in long-running processes
+@functools.lru_cache(maxsize=256, typed=True)
+def _compile_wait_condition(condition_type: str, value: Union[str, int],
+                            timeout_ms: Optional[int]) -> WaitResolver:
+    """Build the async check for a wait condition."""
+    if condition_type == "timeout":
+        delay = value / 1000.0  # Convert ms to seconds
+
+        async def resolve(page: Page) -> bool:
+            await _sleep(delay)
+            return True
+
+    elif condition_type == "selector":
+        async def resolve(page: Page) -> bool:
+            await page.wait_for_selector(value, timeout=timeout_ms, state="visible")
+            return True
+
+    elif condition_type == "url_contains":
+        async def resolve(page: Page) -> bool:
+            return value in page.url
+
+    elif condition_type == "element_count":
+        async def resolve(page: Page) -> bool:
+            # locator.count() counts in the page without returning handles and accepts every selector engine
+            return await page.locator(value).count() > 0
+
+    else:
+        async def resolve(page: Page) -> bool:
+            return False
+
+    return resolve
+
+
+def get_wait_resolver(condition: WaitCondition) -> WaitResolver:
+    """Return the compiled resolver for a wait condition, compiling it on first use."""
+    return _compile_wait_condition(condition.type, condition.value, condition.timeout_ms)
+
 
 class InstructionContext:
     """Context object passed between instruction handlers."""
 
-    def __init__(self, page: Page, variables: Optional[Dict[str, Any]] = None):
+    __slots__ = ('page', 'variables', 'collected_data', 'loop_counters', 'metadata')
+
+    def __init__(self, page: Page, variables: Optional[Dict[str, Any]] = None,
+                 collection_names: Iterable[str] = ()):
         self.page = page
         self.variables = variables or {}
-        self.collected_data: Dict[str, List[Dict[str, Any]]] = {}
-        self.loop_counters: Dict[str, int] = {}
+        # Buckets for known collections are created up front
+        self.collected_data: Dict[str, List[Dict[str, Any]]] = {name: [] for name in collection_names}
+        self.loop_counters: Dict[int, int] = {}
         self.metadata: Dict[str, Any] = {}
 
 
 class InstructionHandler(ABC):
     """Abstract base class for instruction handlers."""
 
-    def __init__(self):
-        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+    logger = logging.getLogger(f"{__name__}.InstructionHandler")
+
+    def __init_subclass__(cls, **kwargs):
+        """Give every handler class its own logger, created once per class."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
 
     @abstractmethod
     async def execute(self, instruction: Instruction, context: InstructionContext) -> bool:
@@ -52,27 +202,7 @@ class InstructionHandler(ABC):
     async def handle_wait_condition(self, condition: WaitCondition, context: InstructionContext) -> bool:
         """Handle a wait condition."""
         try:
-            if condition.type == "timeout":
-                await asyncio.sleep(condition.value / 1000.0)  # Convert ms to seconds
-                return True
-
-            elif condition.type == "selector":
-                await context.page.wait_for_selector(
-                    condition.value,
-                    timeout=condition.timeout_ms,
-                    state="visible"
-                )
-                return True
-
-            elif condition.type == "url_contains":
-                current_url = context.page.url
-                return condition.value in current_url
-
-            elif condition.type == "element_count":
-                count = len(await context.page.query_selector_all(condition.value))
-                return count > 0
-
-            return False
+            return await get_wait_resolver(condition)(context.page)
 
         except PlaywrightTimeoutError:
             self.logger.warning(f"Wait condition timed out: {condition}")
@@ -88,26 +218,27 @@ class ClickHandler(InstructionHandler):
     async def execute(self, instruction: ClickInstruction, context: InstructionContext) -> bool:
         """Execute click instruction."""
         try:
-            self.logger.info(f"Executing click on: {instruction.selector}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Executing click on: {instruction.selector}")
 
             if instruction.all_matching:
-                # Click all matching elements
-                elements = await context.page.query_selector_all(instruction.selector)
-                if not elements and not instruction.optional:
+                if instruction.native_click:
+                    # Real clicks through Playwright, so every selector engine works
+                    matched_count, clicked_count = await self._native_click_visible(instruction, context)
+                else:
+                    # Opt-in: click all visible matching elements in a single evaluate
+                    matched_count, clicked_count = await context.page.evaluate(
+                        CLICK_ALL_VISIBLE_JS, instruction.selector
+                    ) or (0, 0)
+                    if clicked_count:
+                        await _sleep(0.5)  # Let page handlers settle once after the batch
+
+                if not matched_count and not instruction.optional:
                     self.logger.error(f"No elements found for selector: {instruction.selector}")
                     return False
 
-                clicked_count = 0
-                for element in elements:
-                    try:
-                        if await element.is_visible():
-                            await element.click()
-                            clicked_count += 1
-                            await asyncio.sleep(0.5)  # Small delay between clicks
-                    except Exception as e:
-                        self.logger.warning(f"Failed to click element: {e}")
-                        if not instruction.optional:
-                            continue
+                if matched_count and not clicked_count:
+                    self.logger.warning(f"No visible elements to click for selector: {instruction.selector}")
 
                 self.logger.info(f"Clicked {clicked_count} elements")
 
@@ -131,13 +262,33 @@ class ClickHandler(InstructionHandler):
             self.logger.error(f"Error executing click instruction: {e}")
             return not instruction.optional
 
+    async def _native_click_visible(self, instruction: ClickInstruction,
+                                    context: InstructionContext) -> Tuple[int, int]:
+        """Click visible matching elements through Playwright; return (matched, clicked) counts."""
+        # Locators resolve lazily in the browser, so no element handles are retained
+        locator = context.page.locator(instruction.selector)
+        matched_count = await locator.count()
+        clicked_count = 0
+        for index in range(matched_count):
+            element = locator.nth(index)
+            try:
+                if await element.is_visible():
+                    await element.click()
+                    clicked_count += 1
+                    await _sleep(0.5)  # Small delay between clicks
+            except Exception as e:
+                self.logger.warning(f"Failed to click element: {e}")
+
+        return matched_count, clicked_count
+
 
 class WaitHandler(InstructionHandler):
     """Handler for wait instructions."""
 
     async def execute(self, instruction: WaitInstruction, context: InstructionContext) -> bool:
         """Execute wait instruction."""
-        self.logger.info(f"Executing wait: {instruction.condition}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing wait: {instruction.condition}")
         return await self.handle_wait_condition(instruction.condition, context)
 
 
@@ -147,42 +298,49 @@ class LoopHandler(InstructionHandler):
     def __init__(self, instruction_executor):
         super().__init__()
         self.instruction_executor = instruction_executor
+        self._iterators = {
+            'pagination': self._handle_pagination_loop,
+            'dropdown_options': self._handle_dropdown_loop,
+            'count': self._handle_count_loop,
+            'while': self._handle_while_loop
+        }
 
     async def execute(self, instruction: LoopInstruction, context: InstructionContext) -> bool:
         """Execute loop instruction."""
-        self.logger.info(f"Executing loop: {instruction.iterator}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing loop: {instruction.iterator}")
 
-        loop_id = f"loop_{id(instruction)}"
+        loop_id = id(instruction)
         context.loop_counters[loop_id] = 0
 
+        handle_loop = self._iterators.get(instruction.iterator)
+        if handle_loop is None:
+            self.logger.error(f"Unknown loop iterator: {instruction.iterator}")
+            return False
+
         try:
-            if instruction.iterator == "pagination":
-                return await self._handle_pagination_loop(instruction, context, loop_id)
-            elif instruction.iterator == "dropdown_options":
-                return await self._handle_dropdown_loop(instruction, context, loop_id)
-            elif instruction.iterator == "count":
-                return await self._handle_count_loop(instruction, context, loop_id)
-            elif instruction.iterator == "while":
-                return await self._handle_while_loop(instruction, context, loop_id)
-            else:
-                self.logger.error(f"Unknown loop iterator: {instruction.iterator}")
-                return False
+            return await handle_loop(instruction, context, loop_id)
 
         except Exception as e:
             self.logger.error(f"Error in loop execution: {e}")
             return False
 
     async def _handle_pagination_loop(self, instruction: LoopInstruction, context: InstructionContext,
-                                      loop_id: str) -> bool:
+                                      loop_id: int) -> bool:
         """Handle pagination loop."""
         if not instruction.next_selector:
             self.logger.error("Pagination loop requires next_selector")
             return False
 
+        sentinel_selector = self._pagination_sentinel(instruction)
+        # Locators resolve lazily, so one instance serves every page
+        next_button = context.page.locator(instruction.next_selector).first
+
         while context.loop_counters[loop_id] < instruction.max_iterations:
             # Execute loop instructions
-            for loop_instruction in instruction.instructions:
-                await self.instruction_executor.execute_instruction(loop_instruction, context)
+            if not await self.instruction_executor.execute_instructions(instruction.instructions, context):
+                self.logger.error("Loop body failed, stopping loop")
+                return False
 
             # Check break condition
             if instruction.break_condition:
@@ -192,8 +350,7 @@ class LoopHandler(InstructionHandler):
 
             # Try to click next button
             try:
-                next_button = await context.page.query_selector(instruction.next_selector)
-                if not next_button:
+                if not await next_button.is_visible():
                     self.logger.info("Next button not found, ending pagination")
                     break
 
@@ -201,8 +358,12 @@ class LoopHandler(InstructionHandler):
                     self.logger.info("Next button disabled, ending pagination")
                     break
 
+                previous_text = None
+                if sentinel_selector:
+                    previous_text = await context.page.evaluate(FIRST_TEXT_JS, sentinel_selector)
+
                 await next_button.click()
-                await asyncio.sleep(2)  # Wait for page to load
+                await self._wait_for_page_change(context, sentinel_selector, previous_text)
 
                 context.loop_counters[loop_id] += 1
 
@@ -212,16 +373,62 @@ class LoopHandler(InstructionHandler):
 
         return True
 
+    @staticmethod
+    def _pagination_sentinel(instruction: LoopInstruction) -> Optional[str]:
+        """CSS selector of the first collected item in the loop body, if there is one."""
+        for loop_instruction in instruction.instructions:
+            if isinstance(loop_instruction, CollectInstruction):
+                selectors = (loop_instruction.container_selector, loop_instruction.item_selector)
+                # The sentinel scripts use querySelector, so XPath and Playwright-only selectors are out
+                if any(s.startswith(('//', 'xpath=')) or _PLAYWRIGHT_ONLY_SELECTOR_RE.search(s.strip())
+                       for s in selectors):
+                    return None
+                return " ".join(selectors)
+        return None
+
+    async def _wait_for_page_change(self, context: InstructionContext, sentinel_selector: Optional[str],
+                                    previous_text: Optional[str]):
+        """Wait until the page has settled after a pagination click.
+
+        Returns as soon as either the network goes idle or the first item's text changes;
+        pages that keep polling never reach networkidle, so waiting for both would always
+        cost the full timeout.
+        """
+        waits = [context.page.wait_for_load_state('networkidle', timeout=PAGE_CHANGE_TIMEOUT_MS)]
+        if sentinel_selector:
+            waits.append(context.page.wait_for_function(
+                TEXT_CHANGED_JS,
+                arg=[sentinel_selector, previous_text],
+                timeout=PAGE_CHANGE_TIMEOUT_MS
+            ))
+
+        pending = {asyncio.ensure_future(wait) for wait in waits}
+        settled = False
+        try:
+            while pending and not settled:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A wait that failed (timeout or script error) does not count; keep waiting on the other
+                settled = any(task.exception() is None for task in done)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not settled:
+            self.logger.debug("Page change not detected after pagination click")
+            await _sleep(0.25)
+
     async def _handle_dropdown_loop(self, instruction: LoopInstruction, context: InstructionContext,
-                                    loop_id: str) -> bool:
+                                    loop_id: int) -> bool:
         """Handle dropdown options loop."""
         if not instruction.dropdown_selector:
             self.logger.error("Dropdown loop requires dropdown_selector")
             return False
 
         try:
-            # Get all options
-            options = await context.page.query_selector_all(f"{instruction.dropdown_selector} option")
+            # Get all option values and texts in one round-trip
+            options = await context.page.evaluate(DROPDOWN_OPTIONS_JS, instruction.dropdown_selector) or []
 
             start_index = 1 if instruction.skip_first_option else 0
 
@@ -230,20 +437,19 @@ class LoopHandler(InstructionHandler):
                     break
 
                 # Select option
-                option_value = await option.get_attribute("value")
-                await context.page.select_option(instruction.dropdown_selector, value=option_value)
+                await context.page.select_option(instruction.dropdown_selector, value=option['value'])
 
                 # Store current option in context
                 context.variables['current_option_index'] = i
-                context.variables['current_option_value'] = option_value
-                context.variables['current_option_text'] = await option.text_content()
+                context.variables['current_option_value'] = option['value']
+                context.variables['current_option_text'] = option['text']
 
                 # Execute loop instructions
-                for loop_instruction in instruction.instructions:
-                    await self.instruction_executor.execute_instruction(loop_instruction, context)
+                if not await self.instruction_executor.execute_instructions(instruction.instructions, context):
+                    self.logger.error("Loop body failed, stopping loop")
+                    return False
 
                 context.loop_counters[loop_id] += 1
-                await asyncio.sleep(1)  # Small delay between options
 
             return True
 
@@ -251,7 +457,7 @@ class LoopHandler(InstructionHandler):
             self.logger.error(f"Error in dropdown loop: {e}")
             return False
 
-    async def _handle_count_loop(self, instruction: LoopInstruction, context: InstructionContext, loop_id: str) -> bool:
+    async def _handle_count_loop(self, instruction: LoopInstruction, context: InstructionContext, loop_id: int) -> bool:
         """Handle count-based loop."""
         if not instruction.count:
             self.logger.error("Count loop requires count parameter")
@@ -264,14 +470,15 @@ class LoopHandler(InstructionHandler):
             context.variables['loop_index'] = i
 
             # Execute loop instructions
-            for loop_instruction in instruction.instructions:
-                await self.instruction_executor.execute_instruction(loop_instruction, context)
+            if not await self.instruction_executor.execute_instructions(instruction.instructions, context):
+                self.logger.error("Loop body failed, stopping loop")
+                return False
 
             context.loop_counters[loop_id] += 1
 
         return True
 
-    async def _handle_while_loop(self, instruction: LoopInstruction, context: InstructionContext, loop_id: str) -> bool:
+    async def _handle_while_loop(self, instruction: LoopInstruction, context: InstructionContext, loop_id: int) -> bool:
         """Handle while loop."""
         if not instruction.while_condition:
             self.logger.error("While loop requires while_condition")
@@ -284,11 +491,11 @@ class LoopHandler(InstructionHandler):
                 break
 
             # Execute loop instructions
-            for loop_instruction in instruction.instructions:
-                await self.instruction_executor.execute_instruction(loop_instruction, context)
+            if not await self.instruction_executor.execute_instructions(instruction.instructions, context):
+                self.logger.error("Loop body failed, stopping loop")
+                return False
 
             context.loop_counters[loop_id] += 1
-            await asyncio.sleep(0.5)  # Small delay to prevent tight loop
 
         return True
 
@@ -302,21 +509,18 @@ class IfHandler(InstructionHandler):
 
     async def execute(self, instruction: IfInstruction, context: InstructionContext) -> bool:
         """Execute conditional instruction."""
-        self.logger.info(f"Executing if condition: {instruction.condition}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing if condition: {instruction.condition}")
 
         try:
             condition_met = await self.handle_wait_condition(instruction.condition, context)
 
             if condition_met:
                 self.logger.info("Condition met, executing then instructions")
-                for then_instruction in instruction.then_instructions:
-                    await self.instruction_executor.execute_instruction(then_instruction, context)
-            else:
-                self.logger.info("Condition not met, executing else instructions")
-                for else_instruction in instruction.else_instructions:
-                    await self.instruction_executor.execute_instruction(else_instruction, context)
+                return await self.instruction_executor.execute_instructions(instruction.then_instructions, context)
 
-            return True
+            self.logger.info("Condition not met, executing else instructions")
+            return await self.instruction_executor.execute_instructions(instruction.else_instructions, context)
 
         except Exception as e:
             self.logger.error(f"Error in conditional instruction: {e}")
@@ -326,41 +530,29 @@ class IfHandler(InstructionHandler):
 class CollectHandler(InstructionHandler):
     """Handler for data collection instructions."""
 
+    def __init__(self):
+        super().__init__()
+        # id(instruction) -> (instruction, payload); the instruction is kept so
+        # a recycled id can never return another instruction's payload
+        self._payload_cache: Dict[int, Tuple[CollectInstruction, Dict[str, Any]]] = {}
+
     async def execute(self, instruction: CollectInstruction, context: InstructionContext) -> bool:
         """Execute collect instruction."""
-        self.logger.info(f"Executing collect: {instruction.name}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing collect: {instruction.name}")
 
         try:
-            # Find container elements
-            containers = await context.page.query_selector_all(instruction.container_selector)
-            if not containers:
-                self.logger.warning(f"No containers found for selector: {instruction.container_selector}")
-                return True  # Not necessarily an error
-
-            collected_items = []
-
-            for container in containers:
-                # Find items within container
-                items = await container.query_selector_all(instruction.item_selector)
-
-                for item in items:
-                    if instruction.limit and len(collected_items) >= instruction.limit:
-                        break
-
-                    # Extract fields from item
-                    item_data = {}
-                    for field_name, field_config in instruction.fields.items():
-                        try:
-                            value = await self._extract_field(item, field_config)
-                            item_data[field_name] = value
-                        except Exception as e:
-                            self.logger.warning(f"Error extracting field {field_name}: {e}")
-                            item_data[field_name] = field_config.default or ""
-
-                    collected_items.append(item_data)
+            payload = self._get_payload(instruction)
+            if payload is not None:
+                # Extract every container/item/field in one round-trip
+                collected_items = await context.page.evaluate(COLLECT_ITEMS_JS, payload) or []
+            else:
+                collected_items = await self._collect_with_handles(instruction, context)
 
-                if instruction.limit and len(collected_items) >= instruction.limit:
-                    break
+            if not collected_items:
+                self.logger.warning(f"No items found for selector: "
+                                    f"{instruction.container_selector} {instruction.item_selector}")
+                return True  # Not necessarily an error
 
             # Store collected data
             context.collected_data[instruction.name] = collected_items
@@ -372,48 +564,102 @@ class CollectHandler(InstructionHandler):
             self.logger.error(f"Error in collect instruction: {e}")
             return False
 
-    async def _extract_field(self, element, field_config) -> str:
-        """Extract field value from element."""
-        try:
-            if isinstance(field_config.selector, list):
-                # Try multiple selectors
-                for selector in field_config.selector:
+    async def _collect_with_handles(self, instruction: CollectInstruction,
+                                    context: InstructionContext) -> List[Dict[str, Any]]:
+        """Collect items through Playwright element handles, for selectors the in-page path cannot run."""
+        collected_items = []
+        containers = await context.page.query_selector_all(instruction.container_selector)
+
+        for container in containers:
+            # Find items within container
+            items = await container.query_selector_all(instruction.item_selector)
+
+            for item in items:
+                if instruction.limit and len(collected_items) >= instruction.limit:
+                    return collected_items
+
+                # Extract fields from item
+                item_data = {}
+                for field_name, field_config in instruction.fields.items():
                     try:
-                        target = await element.query_selector(selector)
-                        if target:
-                            break
-                    except:
-                        continue
-                else:
-                    return field_config.default or ""
-            else:
-                target = await element.query_selector(field_config.selector)
+                        item_data[field_name] = await self._extract_field(item, field_config)
+                    except Exception as e:
+                        self.logger.warning(f"Error extracting field {field_name}: {e}")
+                        item_data[field_name] = field_config.default or ""
 
-            if not target:
-                return field_config.default or ""
+                collected_items.append(item_data)
 
-            # Extract value based on attribute
-            if field_config.attribute == "text":
-                value = await target.text_content() or ""
-            else:
-                value = await target.get_attribute(field_config.attribute) or ""
+        return collected_items
 
-            # Apply processors if configured
-            # (Processor implementation would go here)
+    async def _extract_field(self, element, field_config) -> str:
+        """Extract field value from element."""
+        selectors = field_config.selector if isinstance(field_config.selector, list) else [field_config.selector]
 
-            return value.strip()
+        target = None
+        for selector in selectors:
+            try:
+                target = await element.query_selector(selector)
+            except Exception:
+                target = None
+            if target:
+                break
 
-        except Exception as e:
-            self.logger.warning(f"Error extracting field: {e}")
+        if not target:
             return field_config.default or ""
 
+        # Extract value based on attribute
+        if field_config.attribute == "text":
+            value = await target.text_content() or ""
+        else:
+            value = await target.get_attribute(field_config.attribute) or ""
+
+        return value.strip()
+
+    def _get_payload(self, instruction: CollectInstruction) -> Optional[Dict[str, Any]]:
+        """Return the cached evaluate payload for an instruction, building it once."""
+        cached = self._payload_cache.get(id(instruction))
+        if cached is None or cached[0] is not instruction:
+            cached = (instruction, self._build_payload(instruction))
+            self._payload_cache[id(instruction)] = cached
+        return cached[1]
+
+    @staticmethod
+    def _build_payload(instruction: CollectInstruction) -> Optional[Dict[str, Any]]:
+        """Serialize a collect instruction into the argument for COLLECT_ITEMS_JS.
+
+        Returns None when a selector needs Playwright's selector engine.
+        """
+        fields = {}
+        all_selectors = [instruction.container_selector, instruction.item_selector]
+        for field_name, field_config in instruction.fields.items():
+            selectors = field_config.selector
+            if not isinstance(selectors, list):
+                selectors = [selectors]
+            all_selectors.extend(selectors)
+            fields[field_name] = {
+                'selectors': selectors,
+                'attribute': field_config.attribute,
+                'default': field_config.default or ""
+            }
+
+        if any(_PLAYWRIGHT_ONLY_SELECTOR_RE.search(selector.strip()) for selector in all_selectors):
+            return None
+
+        return {
+            'container_selector': instruction.container_selector,
+            'item_selector': instruction.item_selector,
+            'fields': fields,
+            'limit': instruction.limit
+        }
+
 
 class NavigateHandler(InstructionHandler):
     """Handler for navigation instructions."""
 
     async def execute(self, instruction: NavigateInstruction, context: InstructionContext) -> bool:
         """Execute navigate instruction."""
-        self.logger.info(f"Executing navigate to: {instruction.url}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing navigate to: {instruction.url}")
 
         try:
             await context.page.goto(instruction.url, wait_until='domcontentloaded', timeout=30000)
@@ -433,9 +679,15 @@ class InputHandler(InstructionHandler):
 
     async def execute(self, instruction: InputInstruction, context: InstructionContext) -> bool:
         """Execute input instruction."""
-        self.logger.info(f"Executing input on: {instruction.selector}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing input on: {instruction.selector}")
 
         try:
+            if instruction.clear_first and not instruction.simulate_typing:
+                # fill replaces the current value in one call
+                await context.page.fill(instruction.selector, instruction.value)
+                return True
+
             if instruction.clear_first:
                 await context.page.fill(instruction.selector, "")
 
@@ -453,7 +705,8 @@ class SelectHandler(InstructionHandler):
 
     async def execute(self, instruction: SelectInstruction, context: InstructionContext) -> bool:
         """Execute select instruction."""
-        self.logger.info(f"Executing select on: {instruction.selector}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing select on: {instruction.selector}")
 
         try:
             if instruction.value is not None:
@@ -478,7 +731,8 @@ class ScrollHandler(InstructionHandler):
 
     async def execute(self, instruction: ScrollInstruction, context: InstructionContext) -> bool:
         """Execute scroll instruction."""
-        self.logger.info(f"Executing scroll: {instruction.direction}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing scroll: {instruction.direction}")
 
         try:
             if instruction.direction == "to_element" and instruction.selector:
@@ -491,11 +745,11 @@ class ScrollHandler(InstructionHandler):
 
             elif instruction.direction == "down":
                 amount = instruction.amount or 1000
-                await context.page.evaluate(f"window.scrollBy(0, {amount})")
+                await context.page.evaluate(SCROLL_BY_JS, amount)
 
             elif instruction.direction == "up":
                 amount = instruction.amount or 1000
-                await context.page.evaluate(f"window.scrollBy(0, -{amount})")
+                await context.page.evaluate(SCROLL_BY_JS, -amount)
 
             return True
 
@@ -519,32 +773,108 @@ class InstructionExecutor:
             'select': SelectHandler(),
             'scroll': ScrollHandler()
         }
+        # Bound execute methods, so dispatch is a single dict lookup
+        self._dispatch: Dict[str, Callable[[Instruction, InstructionContext], Awaitable[bool]]] = {
+            instruction_type: handler.execute for instruction_type, handler in self.handlers.items()
+        }
+        # id(instruction list) -> (list, waves of [(instruction, execute)])
+        self._plans: Dict[int, Tuple[List[Instruction], List[List[Tuple[Instruction, Optional[Callable]]]]]] = {}
         self.logger = logging.getLogger(__name__)
 
     async def execute_instruction(self, instruction: Instruction, context: InstructionContext) -> bool:
         """Execute a single instruction."""
-        instruction_type = instruction.type
-        handler = self.handlers.get(instruction_type)
+        execute = self._dispatch.get(instruction.type)
 
-        if not handler:
-            self.logger.error(f"No handler found for instruction type: {instruction_type}")
+        if execute is None:
+            self.logger.error(f"No handler found for instruction type: {instruction.type}")
             return False
 
         try:
-            return await handler.execute(instruction, context)
+            return await execute(instruction, context)
         except Exception as e:
-            self.logger.error(f"Error executing instruction {instruction_type}: {e}")
+            self.logger.error(f"Error executing instruction {instruction.type}: {e}")
             return False
 
     async def execute_instructions(self, instructions: List[Instruction], context: InstructionContext) -> bool:
-        """Execute a list of instructions."""
-        for instruction in instructions:
-            success = await self.execute_instruction(instruction, context)
-            if not success:
-                self.logger.warning(f"Instruction failed but continuing: {instruction.type}")
+        """Execute a list of instructions; consecutive collects run concurrently."""
+        for wave in self._get_plan(instructions):
+            if len(wave) == 1:
+                instruction, execute = wave[0]
+                outcomes = [await self._run_step(instruction, execute, context)]
+            else:
+                outcomes = await asyncio.gather(
+                    *(self._run_step(instruction, execute, context) for instruction, execute in wave)
+                )
+
+            for (instruction, _), success in zip(wave, outcomes):
+                if not success:
+                    if not getattr(instruction, 'optional', False):
+                        self.logger.error(f"Instruction failed, aborting remaining instructions: {instruction.type}")
+                        return False
+                    self.logger.warning(f"Instruction failed but continuing: {instruction.type}")
 
         return True
 
+    async def _run_step(self, instruction: Instruction, execute: Optional[Callable],
+                        context: InstructionContext) -> bool:
+        """Run one planned instruction, turning a missing handler or an exception into failure."""
+        if execute is None:
+            self.logger.error(f"No handler found for instruction type: {instruction.type}")
+            return False
+
+        try:
+            return await execute(instruction, context)
+        except Exception as e:
+            self.logger.error(f"Error executing instruction {instruction.type}: {e}")
+            return False
+
+    def _get_plan(self, instructions: List[Instruction]) -> List[List[Tuple[Instruction, Optional[Callable]]]]:
+        """Resolve handlers for an instruction list once, grouped into waves; loop bodies reuse the result."""
+        cached = self._plans.get(id(instructions))
+        if cached is None or cached[0] is not instructions:
+            cached = (instructions, self._build_waves(instructions))
+            self._plans[id(instructions)] = cached
+        return cached[1]
+
+    def _build_waves(self, instructions: List[Instruction]) -> List[List[Tuple[Instruction, Optional[Callable]]]]:
+        """Group consecutive read-only collects (distinct names) into one wave; everything else runs alone."""
+        waves = []
+        collect_names = set()
+        for instruction in instructions:
+            step = (instruction, self._dispatch.get(instruction.type))
+            concurrent = (isinstance(instruction, CollectInstruction)
+                          and isinstance(self.handlers.get('collect'), CollectHandler))
+
+            if concurrent and waves and collect_names and instruction.name not in collect_names:
+                waves[-1].append(step)
+            else:
+                waves.append([step])
+                collect_names = set()
+            if concurrent:
+                collect_names.add(instruction.name)
+        return waves
+
+    @classmethod
+    def collect_instructions(cls, instructions: List[Instruction]) -> List[CollectInstruction]:
+        """All collect instructions in an instruction tree, in execution order."""
+        collects = []
+        for instruction in instructions:
+            if isinstance(instruction, CollectInstruction):
+                collects.append(instruction)
+            elif isinstance(instruction, LoopInstruction):
+                collects.extend(cls.collect_instructions(instruction.instructions))
+            elif isinstance(instruction, IfInstruction):
+                collects.extend(cls.collect_instructions(instruction.then_instructions))
+                collects.extend(cls.collect_instructions(instruction.else_instructions))
+        return collects
+
+    @classmethod
+    def collection_names(cls, instructions: List[Instruction]) -> List[str]:
+        """Names of all collect instructions in an instruction tree, in execution order."""
+        return [instruction.name for instruction in cls.collect_instructions(instructions)]
+
     def register_handler(self, instruction_type: str, handler: InstructionHandler):
         """Register a custom instruction handler."""
-        self.handlers[instruction_type] = handler
\ No newline at end of file
+        self.handlers[instruction_type] = handler
+        self._dispatch[instruction_type] = handler.execute
+        self._plans.clear()
\ No newline at end of file
@@ -3,14 +3,184 @@ Custom processors for Polymarket data processing and arbitrage detection.
 These processors extend the base processor framework with Polymarket-specific logic.
 """
 
+import functools
 import json
+import logging
 import re
 from decimal import Decimal, InvalidOperation
-from typing import Any, List, Dict
+from typing import Any, FrozenSet, List, Dict, Optional, Tuple
 from scraper.processor_registry import BaseProcessor, register_processor
 
+__all__ = [
+    'ArbitrageCalculatorProcessor',
+    'ArbitrageDetectorProcessor',
+    'OutcomePriceExtractorProcessor',
+    'PolymarketCategoryProcessor',
+    'VolumeFormatterProcessor',
+    'CLOBTokenExtractorProcessor',
+    'MarketStatusNormalizerProcessor',
+    'ProfitCalculatorProcessor',
+    'register_polymarket_processors',
+]
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the except clauses below cover both
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Fallback patterns for price/token/tag strings that are not JSON arrays
+_NUMBER_RE = re.compile(r'[0-9]+\.?[0-9]*')
+_TOKEN_ID_RE = re.compile(r'\d{50,}')  # CLOB token IDs are very long integers
+_TAG_SPLIT_RE = re.compile(r'[,;|]')
+_PLAIN_DECIMAL_RE = re.compile(r'(?:0|[1-9][0-9]*)(?:\.[0-9]+)?')
+
+# (divisor, suffix, format spec) per volume unit, indexed by thousands exponent
+_VOLUME_SCALES = (
+    (1, "", ".2f"),
+    (1_000, "K", ".1f"),
+    (1_000_000, "M", ".1f"),
+    (1_000_000_000, "B", ".1f"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _zero_volume(currency: str) -> str:
+    """Formatted zero volume for a currency, built once per currency."""
+    return f"0 {currency}"
+
+
+# Map various status values to standard ones
+_STATUS_MAPPING = {
+    'true': 'active',
+    'false': 'inactive',
+    '1': 'active',
+    '0': 'inactive',
+    'open': 'active',
+    'closed': 'closed',
+    'resolved': 'resolved',
+    'cancelled': 'cancelled',
+    'suspended': 'suspended'
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_price_string(value: str) -> Tuple[float, ...]:
+    """Parse an outcome prices string such as "[0.45, 0.60]" into floats."""
+    cleaned = value.strip()
+    if "'" in cleaned:
+        cleaned = cleaned.replace("'", '"')
+    if cleaned.startswith('[') and cleaned.endswith(']'):
+        return tuple(map(float, _json_loads(cleaned)))
+
+    # Try to extract numbers with regex
+    return tuple(price for price in map(float, _NUMBER_RE.findall(cleaned)) if price <= 1.0)
+
+
+def _parse_prices(value: Any) -> Optional[Tuple[float, ...]]:
+    """Parse outcome prices from a JSON string, bytes or list; None for unsupported types."""
+    if isinstance(value, str):
+        return _parse_price_string(value)
+    if isinstance(value, list):
+        return tuple(map(float, value))
+    if isinstance(value, (bytes, bytearray)):
+        data = value.strip()
+        if data[:1] == b'[' and data[-1:] == b']' and b"'" not in data:
+            # The JSON decoder reads bytes directly
+            return tuple(map(float, _json_loads(data)))
+        return _parse_price_string(data.decode('utf-8', 'replace'))
+    return None
+
+
+def _binary_price_at(value: str, index: int) -> Optional[float]:
+    """Price at index 0 or 1 of a two-element array string, or None if the fast path does not apply."""
+    text = value.strip()
+    if text[:1] != '[' or text[-1:] != ']' or text.count(',') != 1:
+        return None
+
+    comma = text.find(',')
+    parts = []
+    for part in (text[1:comma], text[comma + 1:-1]):
+        part = part.strip()
+        if len(part) > 1 and part[0] == part[-1] and part[0] in '"\'':
+            part = part[1:-1]
+        # Both elements must be plain JSON decimals, otherwise the full parser decides
+        if not _PLAIN_DECIMAL_RE.fullmatch(part):
+            return None
+        parts.append(part)
+
+    return float(parts[index])
+
+
+def _safe_parse_prices(value: Any, logger: logging.Logger) -> Optional[Tuple[float, ...]]:
+    """Parse outcome prices, logging bad input; None when the value cannot be used."""
+    try:
+        return _parse_prices(value)
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        logger.warning(f"Could not parse outcome prices '{value}': {e}")
+        return None
+
+
+# Category -> keywords; a category scores one point per keyword found in tags or question
+CATEGORY_KEYWORDS = {
+    'politics': ['election', 'president', 'congress', 'senate', 'vote', 'policy', 'government', 'politician'],
+    'sports': ['nfl', 'nba', 'mlb', 'nhl', 'soccer', 'football', 'basketball', 'baseball', 'olympics',
+               'world cup'],
+    'crypto': ['bitcoin', 'ethereum', 'crypto', 'defi', 'nft', 'blockchain', 'coinbase', 'binance'],
+    'economics': ['fed', 'interest rate', 'inflation', 'gdp', 'unemployment', 'stock market', 'recession'],
+    'entertainment': ['oscar', 'emmy', 'grammy', 'movie', 'tv show', 'celebrity', 'awards'],
+    'science': ['spacex', 'nasa', 'climate', 'vaccine', 'discovery', 'research', 'technology'],
+    'business': ['ipo', 'merger', 'earnings', 'ceo', 'company', 'startup', 'acquisition']
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _keyword_automaton(keywords: FrozenSet[str]):
+    """Aho-Corasick automaton over a set of keywords, built once per set; None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=64, typed=True)
+def _normalize_status(value: Any) -> str:
+    """Normalize a raw market status; a feed only uses a handful of distinct values."""
+    status = str(value).lower().strip()
+    return _STATUS_MAPPING.get(status, status)
+
+
+class _PureValueProcessor(BaseProcessor):
+    """Base for processors whose output depends only on the value and arguments."""
+
+    def process_batch(self, values: List[Any], **kwargs) -> List[Any]:
+        """Process a column, computing each distinct scalar value only once."""
+        process = self.process
+        results: Dict[Tuple[type, Any], Any] = {}
+        processed = []
+        for value in values:
+            if isinstance(value, (str, bytes, int, float)):
+                key = (type(value), value)
+                result = results.get(key)
+                if result is None:
+                    result = results[key] = process(value, **kwargs)
+            else:
+                result = process(value, **kwargs)
+            processed.append(result)
+        return processed
+
 
-class ArbitrageCalculatorProcessor(BaseProcessor):
+class ArbitrageCalculatorProcessor(_PureValueProcessor):
     """Processor to calculate implied probability sum from outcome prices."""
 
     def __init__(self):
@@ -21,35 +191,17 @@ class ArbitrageCalculatorProcessor(BaseProcessor):
         if value is None:
             return "1.0"
 
-        try:
-            # Parse the outcome prices (usually a JSON string like "[0.45, 0.60]")
-            if isinstance(value, str):
-                # Clean the string and parse JSON
-                cleaned = value.strip().replace("'", '"')
-                if cleaned.startswith('[') and cleaned.endswith(']'):
-                    prices = json.loads(cleaned)
-                else:
-                    # Try to extract numbers with regex
-                    numbers = re.findall(r'[0-9]+\.?[0-9]*', cleaned)
-                    prices = [float(n) for n in numbers if float(n) <= 1.0]
-            elif isinstance(value, list):
-                prices = value
-            else:
-                return "1.0"
-
-            # Calculate sum of probabilities
-            if not prices:
-                return "1.0"
-
-            total_prob = sum(float(price) for price in prices if 0 <= float(price) <= 1)
-            return f"{total_prob:.6f}"
-
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
-            self.logger.warning(f"Could not parse outcome prices '{value}': {e}")
+        # Parse the outcome prices (usually a JSON string like "[0.45, 0.60]")
+        prices = _safe_parse_prices(value, self.logger)
+        if not prices:
             return "1.0"
 
+        # Calculate sum of probabilities
+        total_prob = sum(price for price in prices if 0.0 <= price <= 1.0)
+        return f"{total_prob:.6f}"
 
-class ArbitrageDetectorProcessor(BaseProcessor):
+
+class ArbitrageDetectorProcessor(_PureValueProcessor):
     """Processor to detect arbitrage opportunities."""
 
     def __init__(self):
@@ -67,42 +219,26 @@ class ArbitrageDetectorProcessor(BaseProcessor):
         if value is None:
             return "false"
 
-        try:
-            # Parse outcome prices
-            if isinstance(value, str):
-                cleaned = value.strip().replace("'", '"')
-                if cleaned.startswith('[') and cleaned.endswith(']'):
-                    prices = json.loads(cleaned)
-                else:
-                    numbers = re.findall(r'[0-9]+\.?[0-9]*', cleaned)
-                    prices = [float(n) for n in numbers if float(n) <= 1.0]
-            elif isinstance(value, list):
-                prices = value
-            else:
-                return "false"
-
-            if not prices or len(prices) < 2:
-                return "false"
-
-            # Calculate total implied probability
-            total_prob = sum(float(price) for price in prices)
+        # Parse outcome prices
+        prices = _safe_parse_prices(value, self.logger)
+        if not prices or len(prices) < 2:
+            return "false"
 
-            # Account for trading fees
-            fee_adjusted_total = total_prob + trading_fee
+        # Calculate total implied probability
+        total_prob = sum(prices)
 
-            # Check if arbitrage opportunity exists
-            if fee_adjusted_total < (1.0 - min_profit):
-                profit_potential = 1.0 - fee_adjusted_total
-                return f"true,{profit_potential:.4f}"
+        # Account for trading fees
+        fee_adjusted_total = total_prob + trading_fee
 
-            return "false"
+        # Check if arbitrage opportunity exists
+        if fee_adjusted_total < (1.0 - min_profit):
+            profit_potential = 1.0 - fee_adjusted_total
+            return f"true,{profit_potential:.4f}"
 
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
-            self.logger.warning(f"Could not detect arbitrage for '{value}': {e}")
-            return "false"
+        return "false"
 
 
-class OutcomePriceExtractorProcessor(BaseProcessor):
+class OutcomePriceExtractorProcessor(_PureValueProcessor):
     """Processor to extract individual outcome prices from JSON array."""
 
     def __init__(self):
@@ -119,30 +255,23 @@ class OutcomePriceExtractorProcessor(BaseProcessor):
         if value is None:
             return "0.5"
 
-        try:
-            # Parse outcome prices
-            if isinstance(value, str):
-                cleaned = value.strip().replace("'", '"')
-                if cleaned.startswith('[') and cleaned.endswith(']'):
-                    prices = json.loads(cleaned)
-                else:
-                    numbers = re.findall(r'[0-9]+\.?[0-9]*', cleaned)
-                    prices = [float(n) for n in numbers if float(n) <= 1.0]
-            elif isinstance(value, list):
-                prices = value
-            else:
-                return "0.5"
-
-            # Extract price at specified index
-            if index < len(prices):
-                price = float(prices[index])
+        # Binary markets: take the price straight from the string
+        if isinstance(value, str) and (index == 0 or index == 1):
+            price = _binary_price_at(value, index)
+            if price is not None:
                 return f"{price:.6f}"
 
+        # Parse outcome prices
+        prices = _safe_parse_prices(value, self.logger)
+        if prices is None:
             return "0.5"
 
-        except (json.JSONDecodeError, ValueError, TypeError, IndexError) as e:
-            self.logger.warning(f"Could not extract price at index {index} from '{value}': {e}")
-            return "0.5"
+        # Extract price at specified index
+        if -len(prices) <= index < len(prices):
+            price = prices[index]
+            return f"{price:.6f}"
+
+        return "0.5"
 
 
 class PolymarketCategoryProcessor(BaseProcessor):
@@ -150,18 +279,7 @@ class PolymarketCategoryProcessor(BaseProcessor):
 
     def __init__(self):
         super().__init__("polymarket_category")
-
-        # Define category mappings
-        self.category_keywords = {
-            'politics': ['election', 'president', 'congress', 'senate', 'vote', 'policy', 'government', 'politician'],
-            'sports': ['nfl', 'nba', 'mlb', 'nhl', 'soccer', 'football', 'basketball', 'baseball', 'olympics',
-                       'world cup'],
-            'crypto': ['bitcoin', 'ethereum', 'crypto', 'defi', 'nft', 'blockchain', 'coinbase', 'binance'],
-            'economics': ['fed', 'interest rate', 'inflation', 'gdp', 'unemployment', 'stock market', 'recession'],
-            'entertainment': ['oscar', 'emmy', 'grammy', 'movie', 'tv show', 'celebrity', 'awards'],
-            'science': ['spacex', 'nasa', 'climate', 'vaccine', 'discovery', 'research', 'technology'],
-            'business': ['ipo', 'merger', 'earnings', 'ceo', 'company', 'startup', 'acquisition']
-        }
+        self.category_keywords = CATEGORY_KEYWORDS
 
     def process(self, value: Any, question_text: str = "", **kwargs) -> str:
         """
@@ -179,38 +297,49 @@ class PolymarketCategoryProcessor(BaseProcessor):
             tags = []
             if value:
                 if isinstance(value, str):
-                    cleaned = value.strip().replace("'", '"')
+                    cleaned = value.strip()
+                    if "'" in cleaned:
+                        cleaned = cleaned.replace("'", '"')
                     if cleaned.startswith('[') and cleaned.endswith(']'):
-                        tags = json.loads(cleaned)
+                        tags = _json_loads(cleaned)
                     else:
                         # Try to split on common delimiters
-                        tags = [tag.strip() for tag in re.split(r'[,;|]', cleaned) if tag.strip()]
+                        tags = [tag.strip() for tag in _TAG_SPLIT_RE.split(cleaned) if tag.strip()]
                 elif isinstance(value, list):
                     tags = value
 
-            # Combine tags and question for analysis
-            text_to_analyze = ' '.join(tags + [question_text]).lower()
+            # Combine tags and question for analysis, lowercasing the result once
+            if tags:
+                text_to_analyze = ' '.join([*tags, question_text]).lower()
+            else:
+                text_to_analyze = question_text.lower()
+
+            # Keywords are looked up in the set of automaton matches, or searched in the text directly
+            keyword_automaton = _keyword_automaton(
+                frozenset(keyword for keywords in self.category_keywords.values() for keyword in keywords)
+            )
+            if keyword_automaton is not None:
+                haystack = {keyword for _, keyword in keyword_automaton.iter(text_to_analyze)}
+            else:
+                haystack = text_to_analyze
 
-            # Score each category
-            category_scores = {}
+            # Score each category, keeping the first highest scoring one
+            best_category = "general"
+            best_score = 0
             for category, keywords in self.category_keywords.items():
-                score = sum(1 for keyword in keywords if keyword in text_to_analyze)
-                if score > 0:
-                    category_scores[category] = score
-
-            # Return the highest scoring category
-            if category_scores:
-                best_category = max(category_scores, key=category_scores.get)
-                return best_category
+                score = sum(1 for keyword in keywords if keyword in haystack)
+                if score > best_score:
+                    best_category = category
+                    best_score = score
 
-            return "general"
+            return best_category
 
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
             self.logger.warning(f"Could not categorize '{value}': {e}")
             return "general"
 
 
-class VolumeFormatterProcessor(BaseProcessor):
+class VolumeFormatterProcessor(_PureValueProcessor):
     """Processor to format volume numbers with appropriate units."""
 
     def __init__(self):
@@ -225,23 +354,24 @@ class VolumeFormatterProcessor(BaseProcessor):
             currency: Currency symbol (default USD)
         """
         if value is None:
-            return f"0 {currency}"
+            return _zero_volume(currency)
 
         try:
             volume = float(value)
 
-            if volume >= 1_000_000_000:
-                return f"{volume / 1_000_000_000:.1f}B {currency}"
-            elif volume >= 1_000_000:
-                return f"{volume / 1_000_000:.1f}M {currency}"
-            elif volume >= 1_000:
-                return f"{volume / 1_000:.1f}K {currency}"
-            else:
-                return f"{volume:.2f} {currency}"
+            scale = 0
+            if volume >= 1_000:
+                # bit_length gives the power-of-1024 bucket; 1000**n <= 1024**n, so at most one step up
+                scale = min((int(volume).bit_length() - 1) // 10, 3)
+                if scale < 3 and volume >= _VOLUME_SCALES[scale + 1][0]:
+                    scale += 1
 
-        except (ValueError, TypeError) as e:
+            divisor, suffix, spec = _VOLUME_SCALES[scale]
+            return f"{volume / divisor:{spec}}{suffix} {currency}"
+
+        except (ValueError, TypeError, OverflowError) as e:
             self.logger.warning(f"Could not format volume '{value}': {e}")
-            return f"0 {currency}"
+            return _zero_volume(currency)
 
 
 class CLOBTokenExtractorProcessor(BaseProcessor):
@@ -264,12 +394,15 @@ class CLOBTokenExtractorProcessor(BaseProcessor):
         try:
             # Parse CLOB token IDs
             if isinstance(value, str):
-                cleaned = value.strip().replace("'", '"')
+                cleaned = value.strip()
+                if "'" in cleaned:
+                    cleaned = cleaned.replace("'", '"')
                 if cleaned.startswith('[') and cleaned.endswith(']'):
+                    # Stdlib parser: orjson would turn unquoted 77-digit ids into floats
                     token_ids = json.loads(cleaned)
                 else:
                     # Try to extract large numbers (token IDs are very long)
-                    token_ids = re.findall(r'\d{50,}', cleaned)
+                    token_ids = _TOKEN_ID_RE.findall(cleaned)
             elif isinstance(value, list):
                 token_ids = value
             else:
@@ -297,25 +430,14 @@ class MarketStatusNormalizerProcessor(BaseProcessor):
         if value is None:
             return "unknown"
 
-        status = str(value).lower().strip()
-
-        # Map various status values to standard ones
-        status_mapping = {
-            'true': 'active',
-            'false': 'inactive',
-            '1': 'active',
-            '0': 'inactive',
-            'open': 'active',
-            'closed': 'closed',
-            'resolved': 'resolved',
-            'cancelled': 'cancelled',
-            'suspended': 'suspended'
-        }
+        if isinstance(value, (str, int, float)):
+            return _normalize_status(value)
 
-        return status_mapping.get(status, status)
+        # Possibly unhashable, so bypass the cache
+        return _normalize_status.__wrapped__(value)
 
 
-class ProfitCalculatorProcessor(BaseProcessor):
+class ProfitCalculatorProcessor(_PureValueProcessor):
     """Processor to calculate potential profit from arbitrage opportunity."""
 
     def __init__(self):
@@ -333,50 +455,46 @@ class ProfitCalculatorProcessor(BaseProcessor):
         if value is None:
             return "0.00"
 
-        try:
-            # Parse outcome prices
-            if isinstance(value, str):
-                cleaned = value.strip().replace("'", '"')
-                if cleaned.startswith('[') and cleaned.endswith(']'):
-                    prices = json.loads(cleaned)
-                else:
-                    numbers = re.findall(r'[0-9]+\.?[0-9]*', cleaned)
-                    prices = [float(n) for n in numbers if float(n) <= 1.0]
-            elif isinstance(value, list):
-                prices = value
-            else:
-                return "0.00"
+        # Parse outcome prices
+        prices = _safe_parse_prices(value, self.logger)
+        if not prices or len(prices) < 2:
+            return "0.00"
 
-            if not prices or len(prices) < 2:
-                return "0.00"
+        # Calculate arbitrage profit
+        total_prob = sum(prices)
 
-            # Calculate arbitrage profit
-            total_prob = sum(float(price) for price in prices)
+        # A zero price would divide by zero in the position sizing
+        if total_prob >= 1.0 or 0.0 in prices:
+            return "0.00"
 
-            if total_prob < 1.0:
-                # Calculate optimal position sizing
-                position_sizes = [investment * (1 / price) / sum(1 / p for p in prices) for price in prices]
+        # Calculate optimal position sizing (stake proportional to 1 / price)
+        inverse_prices = [1 / price for price in prices]
+        inverse_sum = sum(inverse_prices)
+        if not inverse_sum:
+            return "0.00"
+        total_position = sum(investment * inverse / inverse_sum for inverse in inverse_prices)
 
-                # Calculate expected profit (before fees)
-                expected_return = min(sum(position_sizes) / price for price in prices)
-                gross_profit = expected_return - investment
+        # Calculate expected profit (before fees)
+        expected_return = min(total_position / price for price in prices)
+        gross_profit = expected_return - investment
 
-                # Account for trading fees
-                total_fees = sum(pos * trading_fee for pos in position_sizes)
-                net_profit = gross_profit - total_fees
+        # Account for trading fees
+        total_fees = total_position * trading_fee
+        net_profit = gross_profit - total_fees
 
-                return f"{net_profit:.2f}"
+        return f"{net_profit:.2f}"
 
-            return "0.00"
 
-        except (json.JSONDecodeError, ValueError, TypeError, ZeroDivisionError) as e:
-            self.logger.warning(f"Could not calculate profit for '{value}': {e}")
-            return "0.00"
+# Register all custom processors
+_REGISTERED = False
 
 
-# Register all custom processors
 def register_polymarket_processors():
-    """Register all Polymarket-specific processors."""
+    """Register all Polymarket-specific processors; later calls are no-ops."""
+    global _REGISTERED
+    if _REGISTERED:
+        return
+
     processors = [
         ArbitrageCalculatorProcessor(),
         ArbitrageDetectorProcessor(),
@@ -391,11 +509,9 @@ def register_polymarket_processors():
     for processor in processors:
         register_processor(processor)
 
+    _REGISTERED = True
     print(f"Registered {len(processors)} Polymarket-specific processors")
 
 
 # Auto-register when module is imported
-if __name__ == "__main__":
-    register_polymarket_processors()
-else:
-    register_polymarket_processors()
\ No newline at end of file
+register_polymarket_processors()
\ No newline at end of file
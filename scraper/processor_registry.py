@@ -4,17 +4,170 @@ Implements a pluggable processor system with extensible processors.
 """
 
 import re
+import sys
 import html
 import logging
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 from urllib.parse import urljoin, urlparse
 from decimal import Decimal, InvalidOperation
 from datetime import datetime, timedelta
 import unicodedata
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    # Third-party engine with match timeouts, used for user-supplied patterns
+    import regex
+except ImportError:
+    regex = None
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
 logger = logging.getLogger(__name__)
 
+# Patterns used by the built-in processors, compiled once
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NUMBER_RE = re.compile(r'[\d,]+\.?\d*')
+_NON_DECIMAL_RE = re.compile(r'[^\d.]')
+
+# str.translate table deleting every ASCII character except digits and '.'
+_ODDS_DELETE_TABLE = dict.fromkeys((c for c in range(128) if chr(c) not in '0123456789.'), None)
+
+
+def _as_str(value: Any) -> str:
+    """Convert a processor input to str, skipping the conversion for str values and mapping None to ""."""
+    return value if type(value) is str else ('' if value is None else str(value))
+
+
+# Entities that cover nearly all scraped text, decoded without html.unescape
+_COMMON_ENTITIES = (('&lt;', '<'), ('&gt;', '>'), ('&quot;', '"'), ('&#39;', "'"), ('&nbsp;', '\xa0'))
+
+
+def _unescape(text: str) -> str:
+    """html.unescape with a str.replace fast path for the common entities."""
+    if '&' not in text:
+        return text
+    decoded = text
+    for entity, char in _COMMON_ENTITIES:
+        if entity in decoded:
+            decoded = decoded.replace(entity, char)
+    if decoded.count('&') != decoded.count('&amp;'):
+        # Other references present: let the full decoder handle the original text
+        return html.unescape(text)
+    # Decoded last so '&amp;lt;' becomes '&lt;', as with html.unescape
+    return decoded.replace('&amp;', '&')
+
+
+@functools.lru_cache(maxsize=4096)
+def _join_url(base_url: str, url: str) -> str:
+    """Resolve a relative URL; pages repeat the same links against one base URL."""
+    return urljoin(base_url, url)
+
+
+# Upper bound for one user-supplied pattern search/sub (only enforced with the regex package)
+REGEX_TIMEOUT_SECONDS = 0.05
+_REGEX_CALL_KWARGS = {'timeout': REGEX_TIMEOUT_SECONDS} if regex is not None else {}
+_REGEX_ERRORS = (re.error, regex.error) if regex is not None else (re.error,)
+
+
+def _iter_subpatterns(av):
+    """Yield parsed subpatterns nested in an opcode argument."""
+    if isinstance(av, sre_parse.SubPattern):
+        yield av
+    elif isinstance(av, (list, tuple)):
+        for item in av:
+            yield from _iter_subpatterns(item)
+
+
+def _sole_element(parsed):
+    """The only element of a parsed pattern, looking through groups; None if there are several."""
+    while len(parsed) == 1:
+        op, av = parsed[0]
+        if op is not sre_parse.SUBPATTERN:
+            return parsed[0]
+        parsed = av[-1]
+    return None
+
+
+def _is_variable_repeat(element) -> bool:
+    """Whether a parsed element is a quantifier with a variable match count."""
+    op, av = element
+    return op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[1] > av[0]
+
+
+def _has_nested_quantifier(parsed) -> bool:
+    """Whether an unbounded quantifier directly repeats a variable-length one, e.g. (a+)+ or (\\w*)*.
+
+    There both repeats match the same text, so a failing search tries every way of splitting it;
+    patterns like (\\w+\\s?)+ are left to the match timeout.
+    """
+    for op, av in parsed:
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, high, item = av
+            if high == sre_parse.MAXREPEAT:
+                inner = _sole_element(item)
+                if inner is not None and _is_variable_repeat(inner):
+                    return True
+            if _has_nested_quantifier(item):
+                return True
+        else:
+            for subpattern in _iter_subpatterns(av):
+                if _has_nested_quantifier(subpattern):
+                    return True
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str):
+    """Check and compile a user-supplied regex once; field configs reuse the same few patterns."""
+    if _has_nested_quantifier(sre_parse.parse(pattern)):
+        raise re.error("nested quantifiers can backtrack catastrophically", pattern)
+    if regex is not None:
+        return regex.compile(pattern)
+    return re.compile(pattern)
+
+
+# Common date formats, tried in order when no input format is given
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d-%m-%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+)
+_DATE_SEPARATORS = ('-', '/', ':')
+
+
+def _separator_key(text: str) -> tuple:
+    return tuple(separator in text for separator in _DATE_SEPARATORS)
+
+
+# A format can only match a value containing exactly its literal separators
+_DATE_FORMATS_BY_SEPARATORS: Dict[tuple, tuple] = {}
+for _fmt in _DATE_FORMATS:
+    _DATE_FORMATS_BY_SEPARATORS.setdefault(_separator_key(_fmt), ())
+    _DATE_FORMATS_BY_SEPARATORS[_separator_key(_fmt)] += (_fmt,)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_common_date(value_str: str) -> Optional[datetime]:
+    """Parse a date string with the first matching common format, or None."""
+    for fmt in _DATE_FORMATS_BY_SEPARATORS.get(_separator_key(value_str), ()):
+        try:
+            return datetime.strptime(value_str, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 class ProcessorError(Exception):
     """Custom exception for processor errors."""
@@ -24,6 +177,10 @@ class ProcessorError(Exception):
 class BaseProcessor(ABC):
     """Abstract base class for field processors."""
 
+    # Expression equivalent to process() without args, with {value} as the input;
+    # used by ProcessorRegistry.compile_pipeline. Subclasses overriding process() must reset it.
+    inline_template: Optional[str] = None
+
     def __init__(self, name: str):
         self.name = name
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
@@ -42,6 +199,31 @@ class BaseProcessor(ABC):
         """
         pass
 
+    def process_batch(self, values: List[Any], **kwargs) -> List[Any]:
+        """
+        Process a column of values with the same arguments.
+
+        Args:
+            values: The values to process
+            **kwargs: Additional processor-specific arguments
+
+        Returns:
+            The processed values, in input order
+        """
+        process = self.process
+        return [process(value, **kwargs) for value in values]
+
+    def inline_expression(self, variable: str, args: Dict[str, Any]) -> Optional[str]:
+        """
+        Python source equivalent to process(variable, **args), for compiled pipelines.
+
+        Returns:
+            The expression, or None if this processor has to be called
+        """
+        if self.inline_template is None:
+            return None
+        return self.inline_template.format(value=variable)
+
     def validate_args(self, required_args: List[str], kwargs: Dict[str, Any]):
         """Validate that required arguments are present."""
         missing = [arg for arg in required_args if arg not in kwargs]
@@ -52,40 +234,45 @@ class BaseProcessor(ABC):
 class TrimProcessor(BaseProcessor):
     """Processor to trim whitespace."""
 
+    inline_template = "_as_str({value}).strip()"
+
     def __init__(self):
         super().__init__("trim")
 
     def process(self, value: Any, **kwargs) -> str:
         """Trim whitespace from string value."""
-        if value is None:
-            return ""
-        return str(value).strip()
+        value_str = _as_str(value)
+        if not value_str or not (value_str[0].isspace() or value_str[-1].isspace()):
+            return value_str
+        return value_str.strip()
 
 
 class UppercaseProcessor(BaseProcessor):
     """Processor to convert to uppercase."""
 
+    inline_template = "_as_str({value}).upper()"
+
     def __init__(self):
         super().__init__("uppercase")
 
     def process(self, value: Any, **kwargs) -> str:
         """Convert string to uppercase."""
-        if value is None:
-            return ""
-        return str(value).upper()
+        value_str = _as_str(value)
+        return value_str if value_str.isupper() else value_str.upper()
 
 
 class LowercaseProcessor(BaseProcessor):
     """Processor to convert to lowercase."""
 
+    inline_template = "_as_str({value}).lower()"
+
     def __init__(self):
         super().__init__("lowercase")
 
     def process(self, value: Any, **kwargs) -> str:
         """Convert string to lowercase."""
-        if value is None:
-            return ""
-        return str(value).lower()
+        value_str = _as_str(value)
+        return value_str if value_str.islower() else value_str.lower()
 
 
 class RegexProcessor(BaseProcessor):
@@ -108,21 +295,24 @@ class RegexProcessor(BaseProcessor):
         if value is None or pattern is None:
             return str(value) if value else ""
 
-        value_str = str(value)
+        value_str = _as_str(value)
 
         try:
             if extract_group is not None:
                 # Extract specific group
-                match = re.search(pattern, value_str)
+                match = _compile_pattern(pattern).search(value_str, **_REGEX_CALL_KWARGS)
                 if match and len(match.groups()) >= extract_group:
                     return match.group(extract_group)
                 return ""
             else:
                 # Replace pattern
-                return re.sub(pattern, replacement, value_str)
-        except re.error as e:
+                return _compile_pattern(pattern).sub(replacement, value_str, **_REGEX_CALL_KWARGS)
+        except _REGEX_ERRORS as e:
             self.logger.error(f"Regex error in pattern '{pattern}': {e}")
             return value_str
+        except TimeoutError:
+            self.logger.error(f"Regex pattern '{pattern}' timed out after {REGEX_TIMEOUT_SECONDS}s")
+            return value_str
 
 
 class ReplaceProcessor(BaseProcessor):
@@ -143,7 +333,15 @@ class ReplaceProcessor(BaseProcessor):
         if value is None or search is None:
             return str(value) if value else ""
 
-        return str(value).replace(search, replace)
+        return _as_str(value).replace(search, replace)
+
+    def inline_expression(self, variable: str, args: Dict[str, Any]) -> Optional[str]:
+        """Inline literal, non-empty searches; anything else goes through process()."""
+        search = args.get('search')
+        replace = args.get('replace', "")
+        if type(search) is not str or not search or type(replace) is not str:
+            return None
+        return f"_as_str({variable}).replace({search!r}, {replace!r})"
 
 
 class StripHtmlProcessor(BaseProcessor):
@@ -154,14 +352,21 @@ class StripHtmlProcessor(BaseProcessor):
 
     def process(self, value: Any, **kwargs) -> str:
         """Strip HTML tags from string."""
-        if value is None:
-            return ""
+        value_str = _as_str(value)
+        if '<' not in value_str:
+            # No tags: plain text, possibly with entities
+            if '&' not in value_str:
+                return value_str.strip()
+            return _unescape(value_str).strip()
+
+        if HTMLParser is not None:
+            # One C-level pass strips tags and decodes entities
+            return HTMLParser(value_str).text(separator='').strip()
 
-        value_str = str(value)
         # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', '', value_str)
+        clean = _HTML_TAG_RE.sub('', value_str)
         # Decode HTML entities
-        clean = html.unescape(clean)
+        clean = _unescape(clean)
         return clean.strip()
 
 
@@ -179,10 +384,7 @@ class AbsoluteUrlProcessor(BaseProcessor):
             value: URL value
             base_url: Base URL for resolution
         """
-        if value is None:
-            return ""
-
-        url_str = str(value).strip()
+        url_str = _as_str(value).strip()
         if not url_str:
             return ""
 
@@ -196,7 +398,7 @@ class AbsoluteUrlProcessor(BaseProcessor):
 
         # Relative URL
         if base_url:
-            return urljoin(base_url, url_str)
+            return _join_url(base_url, url_str)
 
         return url_str
 
@@ -218,10 +420,10 @@ class NumberProcessor(BaseProcessor):
         if value is None:
             return 0
 
-        value_str = str(value)
+        value_str = _as_str(value)
 
         # Extract numbers from string
-        number_match = re.search(r'[\d,]+\.?\d*', value_str.replace(' ', ''))
+        number_match = _NUMBER_RE.search(value_str.replace(' ', ''))
         if not number_match:
             return 0
 
@@ -254,10 +456,7 @@ class DateProcessor(BaseProcessor):
             input_format: Input date format (strptime format)
             output_format: Output date format (strftime format)
         """
-        if value is None:
-            return ""
-
-        value_str = str(value).strip()
+        value_str = _as_str(value).strip()
         if not value_str:
             return ""
 
@@ -267,23 +466,7 @@ class DateProcessor(BaseProcessor):
                 date_obj = datetime.strptime(value_str, input_format)
             else:
                 # Try common formats
-                formats = [
-                    "%Y-%m-%d",
-                    "%d/%m/%Y",
-                    "%m/%d/%Y",
-                    "%d-%m-%Y",
-                    "%Y-%m-%d %H:%M:%S",
-                    "%d/%m/%Y %H:%M",
-                ]
-
-                date_obj = None
-                for fmt in formats:
-                    try:
-                        date_obj = datetime.strptime(value_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-
+                date_obj = _parse_common_date(value_str)
                 if not date_obj:
                     return value_str  # Return original if can't parse
 
@@ -310,22 +493,33 @@ class CleanTextProcessor(BaseProcessor):
             normalize_unicode: Normalize unicode characters
             remove_extra_spaces: Remove extra whitespace
         """
-        if value is None:
-            return ""
-
-        text = str(value)
+        text = _as_str(value)
 
-        if normalize_unicode:
-            # Normalize unicode characters
+        if normalize_unicode and not text.isascii():
+            # Normalize unicode characters (ASCII is already NFKD-normal)
             text = unicodedata.normalize('NFKD', text)
 
         if remove_extra_spaces:
-            # Remove extra whitespace
-            text = re.sub(r'\s+', ' ', text)
+            # Remove extra whitespace; split() uses the same Unicode whitespace as \s
+            return ' '.join(text.split())
 
         return text.strip()
 
 
+class NormalizeTextProcessor(BaseProcessor):
+    """Processor fusing trim, lowercase and clean_text into a single pass."""
+
+    def __init__(self):
+        super().__init__("normalize")
+
+    def process(self, value: Any, **kwargs) -> str:
+        """Lowercase, NFKD-normalize and collapse whitespace, same as trim -> lowercase -> clean_text."""
+        text = _as_str(value).lower()
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text)
+        return ' '.join(text.split())
+
+
 class SplitProcessor(BaseProcessor):
     """Processor to split text and extract parts."""
 
@@ -341,10 +535,7 @@ class SplitProcessor(BaseProcessor):
             delimiter: Split delimiter
             index: Index of part to extract
         """
-        if value is None:
-            return ""
-
-        parts = str(value).split(delimiter)
+        parts = _as_str(value).split(delimiter)
 
         try:
             return parts[index].strip()
@@ -366,10 +557,7 @@ class OddsProcessor(BaseProcessor):
             value: Odds value
             format_type: Output format (decimal, fractional, american)
         """
-        if value is None:
-            return ""
-
-        value_str = str(value).strip()
+        value_str = _as_str(value).strip()
         if not value_str:
             return ""
 
@@ -377,32 +565,35 @@ class OddsProcessor(BaseProcessor):
             # Extract decimal odds
             if '/' in value_str:
                 # Fractional odds (e.g., "5/2")
-                parts = value_str.split('/')
-                if len(parts) == 2:
-                    decimal = (float(parts[0]) / float(parts[1])) + 1.0
+                numerator, _, denominator = value_str.partition('/')
+                if '/' not in denominator:
+                    decimal = (float(numerator) / float(denominator)) + 1.0
                 else:
                     decimal = 1.0
-            else:
+            elif value_str.isascii():
                 # Assume decimal odds
-                decimal = float(re.sub(r'[^\d.]', '', value_str))
+                decimal = float(value_str.translate(_ODDS_DELETE_TABLE))
+            else:
+                # \d also keeps non-ASCII digits, which float() understands
+                decimal = float(_NON_DECIMAL_RE.sub('', value_str))
 
             if format_type == "decimal":
-                return f"{decimal:.2f}"
+                return format(decimal, '.2f')
             elif format_type == "fractional":
                 # Convert to fractional
                 frac = decimal - 1.0
                 # Simplified fraction conversion
-                return f"{frac:.2f}/1"
+                return format(frac, '.2f') + "/1"
             elif format_type == "american":
                 # Convert to American odds
                 if decimal >= 2.0:
                     american = (decimal - 1) * 100
-                    return f"+{american:.0f}"
+                    return "+" + format(american, '.0f')
                 else:
                     american = -100 / (decimal - 1)
-                    return f"{american:.0f}"
+                    return format(american, '.0f')
 
-            return f"{decimal:.2f}"
+            return format(decimal, '.2f')
 
         except (ValueError, ZeroDivisionError) as e:
             self.logger.warning(f"Could not process odds '{value_str}': {e}")
@@ -412,8 +603,20 @@ class OddsProcessor(BaseProcessor):
 class ProcessorRegistry:
     """Registry for managing field processors."""
 
+    # Resolved pipelines kept before the cache is reset
+    _PIPELINE_CACHE_SIZE = 256
+
+    # Consecutive argument-less stages replaced by NormalizeTextProcessor at resolve time
+    _NORMALIZE_CHAIN = (TrimProcessor, LowercaseProcessor, CleanTextProcessor)
+
     def __init__(self):
         self._processors: Dict[str, BaseProcessor] = {}
+        # Default processors, instantiated by get() on first use
+        self._factories: Dict[str, Callable[[], BaseProcessor]] = {}
+        # id(processors list) -> (processors list, [(processor, args), ...])
+        self._pipeline_cache: Dict[int, tuple] = {}
+        # id(processors list) -> (processors list, context, compiled function)
+        self._compiled_pipelines: Dict[int, tuple] = {}
         self.logger = logging.getLogger(__name__)
 
         # Register default processors
@@ -421,36 +624,39 @@ class ProcessorRegistry:
 
     def _register_default_processors(self):
         """Register default processors."""
-        default_processors = [
-            TrimProcessor(),
-            UppercaseProcessor(),
-            LowercaseProcessor(),
-            RegexProcessor(),
-            ReplaceProcessor(),
-            StripHtmlProcessor(),
-            AbsoluteUrlProcessor(),
-            NumberProcessor(),
-            DateProcessor(),
-            CleanTextProcessor(),
-            SplitProcessor(),
-            OddsProcessor(),
-        ]
-
-        for processor in default_processors:
-            self._processors[processor.name] = processor
+        self._factories.update({
+            'trim': TrimProcessor,
+            'uppercase': UppercaseProcessor,
+            'lowercase': LowercaseProcessor,
+            'regex': RegexProcessor,
+            'replace': ReplaceProcessor,
+            'strip_html': StripHtmlProcessor,
+            'absolute_url': AbsoluteUrlProcessor,
+            'number': NumberProcessor,
+            'date': DateProcessor,
+            'clean_text': CleanTextProcessor,
+            'normalize': NormalizeTextProcessor,
+            'split': SplitProcessor,
+            'odds': OddsProcessor,
+        })
 
     def register(self, processor: BaseProcessor):
         """Register a custom processor."""
         self._processors[processor.name] = processor
+        self._pipeline_cache.clear()
+        self._compiled_pipelines.clear()
         self.logger.info(f"Registered processor: {processor.name}")
 
     def get(self, name: str) -> Optional[BaseProcessor]:
         """Get a processor by name."""
-        return self._processors.get(name)
+        processor = self._processors.get(name)
+        if processor is None and name in self._factories:
+            processor = self._processors[name] = self._factories[name]()
+        return processor
 
     def list_processors(self) -> List[str]:
         """Get list of available processor names."""
-        return list(self._processors.keys())
+        return list(self._factories) + [name for name in self._processors if name not in self._factories]
 
     def process_value(self, value: Any, processors: List[Union[str, Dict[str, Any]]],
                       context: Optional[Dict[str, Any]] = None) -> Any:
@@ -468,34 +674,172 @@ class ProcessorRegistry:
         current_value = value
         context = context or {}
 
-        for processor_config in processors:
-            if isinstance(processor_config, str):
-                # Simple processor name
-                processor_name = processor_config
-                processor_args = {}
-            elif isinstance(processor_config, dict):
-                # Processor with arguments
-                processor_name = processor_config.get('name')
-                processor_args = processor_config.get('args', {})
-            else:
-                self.logger.warning(f"Invalid processor config: {processor_config}")
-                continue
-
-            processor = self.get(processor_name)
-            if not processor:
-                self.logger.warning(f"Unknown processor: {processor_name}")
-                continue
-
+        for processor, processor_args in self._resolve_pipeline(processors):
             try:
                 # Merge context with processor args
-                merged_args = {**context, **processor_args}
+                merged_args = {**context, **processor_args} if context else processor_args
                 current_value = processor.process(current_value, **merged_args)
             except Exception as e:
-                self.logger.error(f"Error in processor {processor_name}: {e}")
+                self.logger.error(f"Error in processor {processor.name}: {e}")
                 # Continue with current value on error
 
         return current_value
 
+    def process_column(self, values: List[Any], processors: List[Union[str, Dict[str, Any]]],
+                       context: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Process a column of values through a pipeline of processors, one stage at a time.
+
+        Args:
+            values: Input values
+            processors: List of processor names or configs
+            context: Additional context for processors
+
+        Returns:
+            Processed values, in input order
+        """
+        current_values = list(values)
+        context = context or {}
+
+        for processor, processor_args in self._resolve_pipeline(processors):
+            # Merge context with processor args
+            merged_args = {**context, **processor_args} if context else processor_args
+            try:
+                current_values = processor.process_batch(current_values, **merged_args)
+            except Exception:
+                # Redo the stage value by value so only failing values keep their input
+                current_values = [
+                    self._process_or_keep(processor, current_value, merged_args)
+                    for current_value in current_values
+                ]
+
+        return current_values
+
+    def compile_pipeline(self, processors: List[Union[str, Dict[str, Any]]],
+                         context: Optional[Dict[str, Any]] = None) -> Callable[[Any], Any]:
+        """
+        Compile a pipeline into one generated function, equivalent to process_value.
+
+        Stages with an inline expression are spliced into the function body; the
+        others become direct calls with their args merged ahead of time.
+
+        Args:
+            processors: List of processor names or configs
+            context: Additional context for processors
+
+        Returns:
+            Function taking the input value and returning the processed value
+        """
+        context = context or {}
+        cached = self._compiled_pipelines.get(id(processors))
+        if cached is not None and cached[0] is processors and cached[1] == context:
+            return cached[2]
+
+        namespace = {'_as_str': _as_str, '_log_stage_error': self._log_stage_error}
+        lines = ['def _pipeline(value):']
+        for index, (processor, processor_args) in enumerate(self._resolve_pipeline(processors)):
+            merged_args = {**context, **processor_args} if context else processor_args
+            expression = processor.inline_expression('value', merged_args)
+            if expression is None:
+                namespace[f'_process_{index}'] = processor.process
+                namespace[f'_args_{index}'] = merged_args
+                expression = f'_process_{index}(value, **_args_{index})' if merged_args else f'_process_{index}(value)'
+            namespace[f'_processor_{index}'] = processor
+            lines += [
+                '    try:',
+                f'        value = {expression}',
+                '    except Exception as e:',
+                f'        _log_stage_error(_processor_{index}, e)',
+            ]
+        lines.append('    return value')
+
+        exec(compile('\n'.join(lines), '<pipeline>', 'exec'), namespace)
+        pipeline = namespace['_pipeline']
+
+        if len(self._compiled_pipelines) >= self._PIPELINE_CACHE_SIZE:
+            self._compiled_pipelines.clear()
+        self._compiled_pipelines[id(processors)] = (processors, dict(context), pipeline)
+        return pipeline
+
+    def _log_stage_error(self, processor: BaseProcessor, error: Exception):
+        """Log a failed stage in a compiled pipeline, which then keeps its current value."""
+        self.logger.error(f"Error in processor {processor.name}: {error}")
+
+    def _resolve_pipeline(self, processors: List[Union[str, Dict[str, Any]]]) -> List[tuple]:
+        """
+        Resolve a pipeline to [(processor, args), ...], skipping unusable entries.
+
+        Results are cached by the identity of the processors list, so a list
+        mutated in place after its first use keeps its old resolution.
+        """
+        cached = self._pipeline_cache.get(id(processors))
+        if cached is not None and cached[0] is processors:
+            return cached[1]
+
+        resolved_pipeline = []
+        for processor_config in processors:
+            resolved = self._resolve_processor(processor_config)
+            if resolved is not None:
+                resolved_pipeline.append(resolved)
+        resolved_pipeline = self._fuse_normalize_chain(resolved_pipeline)
+
+        if len(self._pipeline_cache) >= self._PIPELINE_CACHE_SIZE:
+            self._pipeline_cache.clear()
+        self._pipeline_cache[id(processors)] = (processors, resolved_pipeline)
+        return resolved_pipeline
+
+    def _fuse_normalize_chain(self, pipeline: List[tuple]) -> List[tuple]:
+        """Replace each trim -> lowercase -> clean_text run without args by the fused normalize stage."""
+        chain_length = len(self._NORMALIZE_CHAIN)
+        if len(pipeline) < chain_length:
+            return pipeline
+        normalize = self.get('normalize')
+        if type(normalize) is not NormalizeTextProcessor:
+            return pipeline
+
+        fused = []
+        index = 0
+        while index < len(pipeline):
+            window = pipeline[index:index + chain_length]
+            if (len(window) == chain_length
+                    and not any(args for _, args in window)
+                    and tuple(type(processor) for processor, _ in window) == self._NORMALIZE_CHAIN):
+                fused.append((normalize, {}))
+                index += chain_length
+            else:
+                fused.append(pipeline[index])
+                index += 1
+        return fused
+
+    def _resolve_processor(self, processor_config: Union[str, Dict[str, Any]]) -> Optional[tuple]:
+        """Resolve a processor config to (processor, args), or None if it cannot be used."""
+        if isinstance(processor_config, str):
+            # Simple processor name
+            processor_name = processor_config
+            processor_args = {}
+        elif isinstance(processor_config, dict):
+            # Processor with arguments
+            processor_name = processor_config.get('name')
+            processor_args = processor_config.get('args', {})
+        else:
+            self.logger.warning(f"Invalid processor config: {processor_config}")
+            return None
+
+        processor = self.get(processor_name)
+        if not processor:
+            self.logger.warning(f"Unknown processor: {processor_name}")
+            return None
+
+        return processor, processor_args
+
+    def _process_or_keep(self, processor: BaseProcessor, value: Any, args: Dict[str, Any]) -> Any:
+        """Process a single value, keeping it unchanged if the processor fails."""
+        try:
+            return processor.process(value, **args)
+        except Exception as e:
+            self.logger.error(f"Error in processor {processor.name}: {e}")
+            return value
+
 
 # Global processor registry instance
 processor_registry = ProcessorRegistry()
@@ -516,31 +860,30 @@ def process_field(value: Any, processors: List[Union[str, Dict[str, Any]]],
 class BookmakerNameProcessor(BaseProcessor):
     """Custom processor for normalizing bookmaker names."""
 
+    # Common normalization rules; the first pattern (in this order) found in the name wins
+    NORMALIZATIONS = {
+        'bet365': 'Bet365',
+        'william hill': 'William Hill',
+        'betfair': 'Betfair',
+        'pinnacle': 'Pinnacle',
+        '1xbet': '1xBet',
+    }
+
     def __init__(self):
         super().__init__("bookmaker_name")
 
+        # Interned so every row shares one object per canonical name
+        self._normalizations = {pattern: sys.intern(normalized) for pattern, normalized in self.NORMALIZATIONS.items()}
+
     def process(self, value: Any, **kwargs) -> str:
         """Normalize bookmaker names."""
-        if value is None:
-            return ""
-
-        name = str(value).strip()
-
-        # Common normalization rules
-        normalizations = {
-            'bet365': 'Bet365',
-            'william hill': 'William Hill',
-            'betfair': 'Betfair',
-            'pinnacle': 'Pinnacle',
-            '1xbet': '1xBet',
-        }
-
+        name = _as_str(value).strip()
         name_lower = name.lower()
-        for pattern, normalized in normalizations.items():
+        for pattern, normalized in self._normalizations.items():
             if pattern in name_lower:
                 return normalized
 
-        return name
+        return sys.intern(name)
 
 
 # Register custom processor
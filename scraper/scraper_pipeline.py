@@ -1,23 +1,146 @@
 import asyncio
+import functools
+import hashlib
 import logging
 import json
-from typing import Dict, Any, List, Optional, Tuple
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from datetime import datetime
 from contextlib import asynccontextmanager
 
-from .config_schema import ScraperConfig, FetcherType
-from .fetcher_strategies import FetcherFactory, FetcherStrategy, InteractiveFetcher, APIFetcher
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from requests.adapters import HTTPAdapter
+
+from .config_schema import ConfigLoader, ScraperConfig, FetcherType
+from .fetcher_strategies import FetcherFactory, FetcherStrategy, InteractiveFetcher, APIFetcher, _json_loads
 from .instruction_handlers import InstructionExecutor, InstructionContext
 from .processor_registry import processor_registry
-from database.config import initialize_database, get_db_manager
+from database.config import DatabaseManager, initialize_database, get_db_manager
 from database.models import Bookmaker, Category, Event, NormalizedEvent, Market, MarketSelection
 
 logger = logging.getLogger(__name__)
 
+# Pipelines allowed to run at once in this process, across all runners
+MAX_CONCURRENT_PIPELINES = int(os.getenv("SCRAPER_MAX_PIPELINES", "16"))
+
+# Event loop -> pipeline semaphore; asyncio primitives can't be shared between loops
+_pipeline_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.BoundedSemaphore]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _pipeline_semaphore() -> asyncio.BoundedSemaphore:
+    """Semaphore limiting concurrent pipelines on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _pipeline_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _pipeline_semaphores[loop] = asyncio.BoundedSemaphore(MAX_CONCURRENT_PIPELINES)
+    return semaphore
+
+
+# Session factory -> (table name, name) -> id; ids only hold for the database behind that factory
+_name_id_caches: "weakref.WeakKeyDictionary[sessionmaker, Dict[Tuple[str, str], int]]" = \
+    weakref.WeakKeyDictionary()
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {'postgresql': pg_insert, 'sqlite': sqlite_insert}
+
+
+_db_init_lock = threading.Lock()
+
+
+def _shared_db_manager() -> DatabaseManager:
+    """The process-wide database manager, initialized from environment variables on first use."""
+    with _db_init_lock:
+        try:
+            return get_db_manager()
+        except RuntimeError:
+            db_manager = initialize_database()
+            logger.info("Database initialized from environment variables")
+            return db_manager
+
+
+def _name_id_cache(session_factory: sessionmaker) -> Dict[Tuple[str, str], int]:
+    """Name id cache of a session factory; cleared whenever one of its sessions rolls back."""
+    cache = _name_id_caches.get(session_factory)
+    if cache is None:
+        cache = _name_id_caches[session_factory] = {}
+        event.listen(session_factory, 'after_rollback', lambda session: cache.clear())
+    return cache
+
+
+def _insert_name(session, model, name: str) -> bool:
+    """Insert a row with the given name unless one exists; return True if this call created it."""
+    conflict_insert = _CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+    if conflict_insert is not None:
+        result = session.execute(
+            conflict_insert(model).values(name=name).on_conflict_do_nothing(index_elements=['name'])
+        )
+        return result.rowcount == 1
+
+    # No ON CONFLICT support: a row created concurrently shows up as an IntegrityError
+    try:
+        with session.begin_nested():
+            session.execute(insert(model).values(name=name))
+        return True
+    except IntegrityError:
+        return False
+
+
+def _resolve_name_id(db_manager: DatabaseManager, model, name: str) -> int:
+    """Id of the row with the given name, inserting it if missing; cached per session factory."""
+    cache = _name_id_cache(db_manager.session_factory)
+    key = (model.__tablename__, name)
+    row_id = cache.get(key)
+    if row_id is not None:
+        return row_id
+
+    with db_manager.get_session() as session:
+        row_id = session.scalar(select(model.id).where(model.name == name))
+        if row_id is None:
+            if _insert_name(session, model, name):
+                logger.info(f"Created new {model.__tablename__} entry: {name}")
+            session.commit()
+            row_id = session.scalar(select(model.id).where(model.name == name))
+
+    cache[key] = row_id
+    return row_id
+
+
+@functools.lru_cache(maxsize=65536)
+def _hash_identifier(identifier: str) -> str:
+    """MD5 hex digest of an event identifier; the same markets come back every run."""
+    return hashlib.md5(identifier.encode(), usedforsecurity=False).hexdigest()
+
+
+def _event_mapping_hash(event_data: Dict[str, Any]) -> str:
+    """Mapping hash identifying the same event across runs and bookmakers."""
+    # Use market ID or question for Polymarket
+    identifier = (
+        event_data.get('market_id', '') or
+        event_data.get('question', '') or
+        event_data.get('slug', '')
+    )
+    if identifier:
+        return _hash_identifier(identifier)
+
+    # No identifier: hash the event's repr, as before, so existing mapping_hash rows
+    # still match (unique per event, so not cached)
+    return hashlib.md5(str(event_data).encode(), usedforsecurity=False).hexdigest()
+
 
 class ScrapingResult:
     """Container for scraping results."""
 
+    __slots__ = ('events', 'markets', 'selections', 'errors', 'metadata',
+                 'start_time', 'end_time', '_started_at')
+
     def __init__(self):
         self.events: List[Dict[str, Any]] = []
         self.markets: List[Dict[str, Any]] = []
@@ -26,6 +149,8 @@ class ScrapingResult:
         self.metadata: Dict[str, Any] = {}
         self.start_time: datetime = datetime.utcnow()
         self.end_time: Optional[datetime] = None
+        # Monotonic start for the duration, unaffected by wall-clock adjustments
+        self._started_at = time.monotonic()
 
     def add_error(self, error: str):
         """Add an error to the results."""
@@ -35,13 +160,63 @@ class ScrapingResult:
     def finalize(self):
         """Mark the scraping as complete."""
         self.end_time = datetime.utcnow()
-        self.metadata['duration_seconds'] = (self.end_time - self.start_time).total_seconds()
+        self.metadata['duration_seconds'] = time.monotonic() - self._started_at
         self.metadata['total_events'] = len(self.events)
         self.metadata['total_markets'] = len(self.markets)
         self.metadata['total_selections'] = len(self.selections)
         self.metadata['error_count'] = len(self.errors)
 
 
+def _compile_array_step(spec: str) -> Tuple[Any, ...]:
+    """Compile an array access spec like *, 0 or 0:5 (without brackets) into a path step."""
+    try:
+        if spec == '*':
+            # All items
+            return ('all',)
+        elif ':' in spec:
+            # Slicing like [0:5]
+            parts = spec.split(':')
+            start = int(parts[0]) if parts[0] else None
+            end = int(parts[1]) if parts[1] else None
+            return ('slice', start, end)
+        else:
+            # Single index like [0]
+            return ('item', int(spec))
+    except ValueError:
+        return ('invalid',)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Tuple[Tuple[Any, ...], ...]:
+    """Parse a JSONPath-like selector once into steps: ('item', key), ('all',), ('slice', start, end)."""
+    if path.startswith('$'):
+        path = path[1:]  # Remove leading $
+
+    if not path:
+        return ()
+
+    # Array access like [*] or [0:5]
+    if path.startswith('[') and path.endswith(']'):
+        return (_compile_array_step(path[1:-1]),)
+
+    # Dot notation like .field.subfield
+    if path.startswith('.'):
+        path = path[1:]  # Remove leading dot
+
+    steps = []
+    for part in path.split('.'):
+        if '[' in part and ']' in part:
+            # Array access within path like field[0]
+            field_name, array_part = part.split('[', 1)
+            if field_name:
+                steps.append(('item', field_name))
+            steps.append(_compile_array_step(array_part[:-1]))
+        else:
+            steps.append(('item', part))
+
+    return tuple(steps)
+
+
 class JSONPathExtractor:
     """Extract data from JSON using JSONPath-like selectors."""
 
@@ -50,220 +225,229 @@ class JSONPathExtractor:
 
     def extract(self, data: Any, path: str) -> Any:
         """Extract value from JSON data using simple JSONPath."""
+        return self.extract_compiled(data, _compile_path(path))
+
+    def extract_compiled(self, data: Any, steps: Tuple[Tuple[Any, ...], ...]) -> Any:
+        """Extract value from JSON data using steps from _compile_path."""
+        current = data
+
         try:
-            if path.startswith('$'):
-                path = path[1:]  # Remove leading $
-
-            if not path:
-                return data
-
-            # Handle array access like [*] or [0:5]
-            if path.startswith('[') and path.endswith(']'):
-                return self._handle_array_access(data, path)
-
-            # Handle dot notation like .field.subfield
-            if path.startswith('.'):
-                path = path[1:]  # Remove leading dot
-
-            parts = path.split('.')
-            current = data
-
-            for part in parts:
-                if '[' in part and ']' in part:
-                    # Handle array access within path like field[0]
-                    field_name, array_part = part.split('[', 1)
-                    if field_name:
-                        current = current[field_name]
-                    current = self._handle_array_access(current, '[' + array_part)
+            for step in steps:
+                kind = step[0]
+                if kind == 'item':
+                    current = current[step[1]]
+                elif kind == 'all':
+                    current = list(current)
+                elif kind == 'slice':
+                    current = list(current[step[1]:step[2]])
                 else:
-                    current = current[part]
+                    return None
 
             return current
 
         except (KeyError, IndexError, TypeError, ValueError) as e:
-            self.logger.debug(f"JSONPath extraction failed for path '{path}': {e}")
-            return None
-
-    def _handle_array_access(self, data: Any, array_spec: str) -> Any:
-        """Handle array access patterns like [*], [0], [0:5]."""
-        try:
-            spec = array_spec[1:-1]  # Remove brackets
-
-            if spec == '*':
-                # Return all items
-                return list(data)
-            elif ':' in spec:
-                # Handle slicing like [0:5]
-                parts = spec.split(':')
-                start = int(parts[0]) if parts[0] else None
-                end = int(parts[1]) if parts[1] else None
-                return list(data[start:end])
-            else:
-                # Handle single index like [0]
-                index = int(spec)
-                return data[index]
-
-        except (ValueError, IndexError, TypeError):
+            self.logger.debug(f"JSONPath extraction failed for steps {steps}: {e}")
             return None
 
 
 class DatabasePersister:
     """Simplified database persistence using environment variables."""
 
+    __slots__ = ('logger', 'bookmaker_name', 'category_name', '_db_manager')
+
     def __init__(self, bookmaker_name: str, category_name: str):
         self.logger = logging.getLogger(__name__)
         self.bookmaker_name = bookmaker_name
         self.category_name = category_name
-        self._db_initialized = False
+        self._db_manager: Optional[DatabaseManager] = None
 
-    def _ensure_database_initialized(self):
-        """Ensure database is initialized from environment variables."""
-        if not self._db_initialized:
+    def _get_db_manager(self) -> DatabaseManager:
+        """Database manager shared by the process, initialized on first use."""
+        if self._db_manager is None:
             try:
-                # Initialize database using environment variables
-                initialize_database()
-                self._db_initialized = True
-                self.logger.info("Database initialized from environment variables")
-
+                self._db_manager = _shared_db_manager()
             except Exception as e:
                 self.logger.error(f"Failed to initialize database: {e}")
                 raise
+        return self._db_manager
 
     def get_or_create_bookmaker(self, name: str) -> int:
         """Get or create bookmaker by name and return its ID."""
-        self._ensure_database_initialized()
+        return self._resolve_id(Bookmaker, name)
 
-        try:
-            db_manager = get_db_manager()
-
-            with db_manager.get_session() as session:
-                bookmaker = session.query(Bookmaker).filter_by(name=name).first()
+    def get_or_create_category(self, name: str) -> int:
+        """Get or create category by name and return its ID."""
+        return self._resolve_id(Category, name)
 
-                if not bookmaker:
-                    bookmaker = Bookmaker(name=name)
-                    session.add(bookmaker)
-                    session.commit()
-                    session.refresh(bookmaker)  # Ensure ID is available
-                    self.logger.info(f"Created new bookmaker: {name}")
+    def _resolve_id(self, model, name: str) -> int:
+        """Resolve a bookmaker/category name to its ID, cached for the database manager."""
+        db_manager = self._get_db_manager()
 
-                return bookmaker.id  # Return ID instead of instance
+        try:
+            return _resolve_name_id(db_manager, model, name)
         except Exception as e:
-            self.logger.error(f"Database error creating bookmaker: {e}")
+            self.logger.error(f"Database error resolving {model.__tablename__} '{name}': {e}")
             raise
 
-    def get_or_create_category(self, name: str) -> int:
-        """Get or create category by name and return its ID."""
-        self._ensure_database_initialized()
+    def save_event_data(self, event_data: Dict[str, Any], bookmaker_id: int, category_id: int) -> int:
+        """Save event data to database."""
+        db_manager = self._get_db_manager()
 
         try:
-            db_manager = get_db_manager()
 
             with db_manager.get_session() as session:
-                category = session.query(Category).filter_by(name=name).first()
-
-                if not category:
-                    category = Category(name=name)
-                    session.add(category)
-                    session.commit()
-                    session.refresh(category)  # Ensure ID is available
-                    self.logger.info(f"Created new category: {name}")
-
-                return category.id  # Return ID instead of instance
+                event_id = self._insert_events(session, [event_data], bookmaker_id, category_id)[0]
+                session.commit()
+                return event_id
         except Exception as e:
-            self.logger.error(f"Database error creating category: {e}")
+            self.logger.error(f"Database error saving event: {e}")
             raise
 
-    def save_event_data(self, event_data: Dict[str, Any], bookmaker_id: int, category_id: int) -> int:
-        """Save event data to database."""
-        self._ensure_database_initialized()
+    def save_events_individually(self, events: List[Dict[str, Any]], bookmaker_id: int,
+                                 category_id: int) -> List[Any]:
+        """
+        Save events in one transaction, each inside its own savepoint.
+
+        A failing event only rolls back its savepoint; the others are committed together.
+
+        Returns:
+            Per event, its ID or the exception that prevented saving it
+        """
+        db_manager = self._get_db_manager()
+        outcomes = []
+
+        with db_manager.get_session() as session:
+            for event_data in events:
+                try:
+                    with session.begin_nested():
+                        outcomes.append(self._insert_events(session, [event_data], bookmaker_id, category_id)[0])
+                except Exception as e:
+                    self.logger.error(f"Database error saving event: {e}")
+                    outcomes.append(e)
+
+            session.commit()
+
+        return outcomes
+
+    def save_events_bulk(self, events: List[Dict[str, Any]], bookmaker_id: int, category_id: int) -> List[int]:
+        """Save many events in one transaction, with one batched INSERT per table."""
+        if not events:
+            return []
+
+        db_manager = self._get_db_manager()
 
         try:
-            db_manager = get_db_manager()
 
             with db_manager.get_session() as session:
-                # Create event
-                event = Event(
-                    bookmaker_id=bookmaker_id,
-                    category_id=category_id,
-                    status=event_data.get('status', 'active')  # Fixed: was checking 'active' key
-                )
-                session.add(event)
-                session.flush()  # Get event ID
-
-                # Create normalized event
-                mapping_hash = self._generate_mapping_hash(event_data)
-                normalized_event = NormalizedEvent(
-                    event_id=event.id,
-                    mapping_hash=mapping_hash
-                )
-                session.add(normalized_event)
-                session.flush()
-
-                # Save markets and selections if they exist
-                markets = event_data.get('markets', [])
-                if not markets and event_data.get('outcome_prices'):
-                    # Create a default market from the event data for Polymarket
-                    markets = [{
-                        'type': event_data.get('market_type', 'binary'),
-                        'selections': [
-                            {
-                                'name': 'Yes',
-                                'odds': float(event_data.get('price_yes', 0.5))
-                            },
-                            {
-                                'name': 'No',
-                                'odds': float(event_data.get('price_no', 0.5))
-                            }
-                        ]
-                    }]
-
-                for market_data in markets:
-                    market = Market(
-                        normalized_event_id=normalized_event.id,
-                        market_type=market_data.get('type', 'unknown')
-                    )
-                    session.add(market)
-                    session.flush()
-
-                    for selection_data in market_data.get('selections', []):
-                        try:
-                            odds_value = float(selection_data.get('odds', 0.0))
-                        except (ValueError, TypeError):
-                            odds_value = 0.0
-
-                        selection = MarketSelection(
-                            market_id=market.id,
-                            selection=selection_data.get('name', ''),
-                            odds=odds_value
-                        )
-                        session.add(selection)
-
+                event_ids = self._insert_events(session, events, bookmaker_id, category_id)
                 session.commit()
-                return event.id
+                return event_ids
         except Exception as e:
-            self.logger.error(f"Database error saving event: {e}")
+            self.logger.error(f"Database error saving events in bulk: {e}")
             raise
 
+    def _insert_events(self, session, events: List[Dict[str, Any]], bookmaker_id: int,
+                       category_id: int) -> List[int]:
+        """Insert events with their normalized events, markets and selections; one INSERT per table."""
+        # RETURNING ordered by parameter order lets ids be zipped back onto the input rows
+        event_ids = session.scalars(
+            insert(Event).returning(Event.id, sort_by_parameter_order=True),
+            [
+                {
+                    'bookmaker_id': bookmaker_id,
+                    'category_id': category_id,
+                    'status': event_data.get('status', 'active')
+                }
+                for event_data in events
+            ]
+        ).all()
+
+        normalized_event_ids = session.scalars(
+            insert(NormalizedEvent).returning(NormalizedEvent.id, sort_by_parameter_order=True),
+            [
+                {'event_id': event_id, 'mapping_hash': self._generate_mapping_hash(event_data)}
+                for event_id, event_data in zip(event_ids, events)
+            ]
+        ).all()
+
+        # Flatten markets, remembering each one's selections by position
+        market_rows = []
+        market_selections = []
+        for normalized_event_id, event_data in zip(normalized_event_ids, events):
+            for market_data in self._event_markets(event_data):
+                market_rows.append({
+                    'normalized_event_id': normalized_event_id,
+                    'market_type': market_data.get('type', 'unknown')
+                })
+                market_selections.append(market_data.get('selections', []))
+
+        if market_rows:
+            market_ids = session.scalars(
+                insert(Market).returning(Market.id, sort_by_parameter_order=True),
+                market_rows
+            ).all()
+
+            selection_rows = [
+                {
+                    'market_id': market_id,
+                    'selection': selection_data.get('name', ''),
+                    'odds': self._parse_odds(selection_data)
+                }
+                for market_id, selections in zip(market_ids, market_selections)
+                for selection_data in selections
+            ]
+            if selection_rows:
+                session.execute(insert(MarketSelection), selection_rows)
+
+        return list(event_ids)
+
+    def _event_markets(self, event_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Markets to store for an event, defaulting to a Yes/No market for Polymarket data."""
+        markets = event_data.get('markets', [])
+        if not markets and event_data.get('outcome_prices'):
+            # Create a default market from the event data for Polymarket
+            markets = [{
+                'type': event_data.get('market_type', 'binary'),
+                'selections': [
+                    {
+                        'name': 'Yes',
+                        'odds': float(event_data.get('price_yes', 0.5))
+                    },
+                    {
+                        'name': 'No',
+                        'odds': float(event_data.get('price_no', 0.5))
+                    }
+                ]
+            }]
+        return markets
+
+    def _parse_odds(self, selection_data: Dict[str, Any]) -> float:
+        """Odds of a selection as float, 0.0 when missing or invalid."""
+        odds = selection_data.get('odds', 0.0)
+        # Processed odds are usually floats already
+        if type(odds) is float:
+            return odds
+
+        try:
+            return float(odds)
+        except (ValueError, TypeError):
+            return 0.0
+
     def _generate_mapping_hash(self, event_data: Dict[str, Any]) -> str:
         """Generate mapping hash for event normalization."""
-        import hashlib
-
-        # Use market ID or question for Polymarket
-        identifier = (
-            event_data.get('market_id', '') or
-            event_data.get('question', '') or
-            event_data.get('slug', '') or
-            str(event_data)
-        )
-        return hashlib.md5(identifier.encode()).hexdigest()
+        return _event_mapping_hash(event_data)
 
 
 class ScraperPipeline:
     """Main scraper pipeline that orchestrates the entire process."""
 
-    def __init__(self, config: ScraperConfig):
+    __slots__ = ('config', 'fetcher', 'http_adapter', 'instruction_executor', 'persister',
+                 'json_extractor', 'logger', '_field_fns')
+
+    def __init__(self, config: ScraperConfig, http_adapter: Optional[HTTPAdapter] = None):
         self.config = config
         self.fetcher: Optional[FetcherStrategy] = None
+        self.http_adapter = http_adapter
         self.instruction_executor = InstructionExecutor()
         self.persister = DatabasePersister(
             config.database.bookmaker_name,
@@ -271,6 +455,23 @@ class ScraperPipeline:
         )
         self.json_extractor = JSONPathExtractor()
         self.logger = logging.getLogger(__name__)
+        # id of collect instruction -> field name -> compiled processor chain
+        # (keyed per instruction, since several collects may share a name)
+        self._field_fns = self._compile_field_processors()
+
+    def _compile_field_processors(self) -> Dict[int, Dict[str, Callable[[Any], Any]]]:
+        """Compile the processor chain of every collected field once, for the whole run."""
+        context = {'base_url': self.config.meta.start_url}
+        field_fns: Dict[int, Dict[str, Callable[[Any], Any]]] = {}
+
+        for instruction in self.instruction_executor.collect_instructions(self.config.instructions):
+            field_fns[id(instruction)] = {
+                field_name: processor_registry.compile_pipeline(field_config.processors, context)
+                for field_name, field_config in instruction.fields.items()
+                if field_config.processors
+            }
+
+        return field_fns
 
     async def run(self) -> ScrapingResult:
         """Run the complete scraping pipeline."""
@@ -280,7 +481,7 @@ class ScraperPipeline:
             self.logger.info(f"Starting scraper pipeline: {self.config.meta.name}")
 
             # Initialize fetcher
-            self.fetcher = FetcherFactory.create(self.config.fetcher)
+            self.fetcher = FetcherFactory.create(self.config.fetcher, http_adapter=self.http_adapter)
 
             # Execute scraping based on fetcher type
             if self.config.fetcher.type == FetcherType.INTERACTIVE:
@@ -311,22 +512,31 @@ class ScraperPipeline:
         """Run API scraping with JSON processing."""
         try:
             # Fetch API data
-            fetch_result = await self.fetcher.fetch(self.config.meta.start_url)
-            result.metadata['initial_fetch_size'] = len(fetch_result.content)
-
-            # Parse JSON response
-            try:
-                json_data = json.loads(fetch_result.content)
-                result.metadata['json_parsed'] = True
-                self.logger.info(f"Successfully parsed JSON with {len(json_data) if isinstance(json_data, list) else 1} items")
-            except json.JSONDecodeError as e:
-                result.add_error(f"Failed to parse JSON response: {e}")
-                return
+            urls = [self.config.meta.start_url, *self.config.meta.start_urls]
+            if len(urls) > 1:
+                fetch_results = await self.fetcher.fetch_many(urls)
+            else:
+                fetch_results = [await self.fetcher.fetch(urls[0])]
+            result.metadata['initial_fetch_size'] = sum(
+                fetch_result.content_length or len(fetch_result.content) for fetch_result in fetch_results
+            )
 
-            # Process collect instructions for JSON data
-            for instruction in self.config.instructions:
-                if instruction.type == "collect":
-                    await self._process_json_collection(instruction, json_data, result)
+            for fetch_result in fetch_results:
+                # Parse JSON response
+                try:
+                    json_data = fetch_result.json_data
+                    if json_data is None:
+                        json_data = _json_loads(fetch_result.content)
+                    result.metadata['json_parsed'] = True
+                    self.logger.info(f"Successfully parsed JSON with {len(json_data) if isinstance(json_data, list) else 1} items")
+                except json.JSONDecodeError as e:
+                    result.add_error(f"Failed to parse JSON response from {fetch_result.url}: {e}")
+                    continue
+
+                # Process collect instructions for JSON data
+                for instruction in self.config.instructions:
+                    if instruction.type == "collect":
+                        await self._process_json_collection(instruction, json_data, result)
 
         except Exception as e:
             result.add_error(f"API scraping error: {str(e)}")
@@ -336,60 +546,83 @@ class ScraperPipeline:
         try:
             self.logger.info(f"Processing JSON collection: {instruction.name}")
 
+            extractor = self.json_extractor
+
             # Extract container data
-            container_data = self.json_extractor.extract(json_data, instruction.container_selector)
+            container_data = extractor.extract(json_data, instruction.container_selector)
 
             if not container_data:
                 self.logger.warning(f"No container data found for: {instruction.container_selector}")
                 return
 
             # Extract items from container
-            items_data = self.json_extractor.extract(container_data, instruction.item_selector)
+            items_data = extractor.extract(container_data, instruction.item_selector)
 
             if not isinstance(items_data, list):
                 items_data = [items_data] if items_data is not None else []
 
-            collected_items = []
+            # Field extraction is CPU-bound; run it off the event loop so other pipelines keep going
+            collected_items = await asyncio.to_thread(self._extract_json_items, instruction, items_data)
 
-            for item_data in items_data:
-                if instruction.limit and len(collected_items) >= instruction.limit:
-                    break
+            # Store collected data
+            result.events.extend(collected_items)
+            self.logger.info(f"Collected {len(collected_items)} items for {instruction.name}")
 
-                # Extract fields from item
-                item_result = {}
-                for field_name, field_config in instruction.fields.items():
-                    try:
-                        value = self.json_extractor.extract(item_data, field_config.selector)
+        except Exception as e:
+            result.add_error(f"JSON collection error: {str(e)}")
 
-                        # Apply processors if configured
-                        if field_config.processors and value is not None:
-                            value = processor_registry.process_value(
-                                value,
-                                field_config.processors,
-                                context={'base_url': self.config.meta.start_url}
-                            )
+    def _extract_json_items(self, instruction, items_data: List[Any]) -> List[Dict[str, Any]]:
+        """Extract and process the fields of every JSON item of a collect instruction."""
+        extractor = self.json_extractor
+        collected_items = []
+        field_fns = self._field_fns.get(id(instruction), {})
+
+        # Resolve each field's selector steps, processors and default once, not per item
+        # (non-string selectors keep failing per field)
+        fields = [
+            (
+                field_name,
+                field_config.selector,
+                _compile_path(field_config.selector) if isinstance(field_config.selector, str) else None,
+                field_fns.get(field_name),
+                field_config.default or ""
+            )
+            for field_name, field_config in instruction.fields.items()
+        ]
+
+        for item_data in items_data:
+            if instruction.limit and len(collected_items) >= instruction.limit:
+                break
+
+            # Extract fields from item
+            item_result = {}
+            for field_name, selector, steps, process, default in fields:
+                try:
+                    if steps is not None:
+                        value = extractor.extract_compiled(item_data, steps)
+                    else:
+                        value = extractor.extract(item_data, selector)
 
-                        item_result[field_name] = value if value is not None else field_config.default or ""
+                    # Apply processors if configured
+                    if value is not None and process is not None:
+                        value = process(value)
 
-                    except Exception as e:
-                        self.logger.warning(f"Error extracting field {field_name}: {e}")
-                        item_result[field_name] = field_config.default or ""
+                    item_result[field_name] = value if value is not None else default
 
-                collected_items.append(item_result)
+                except Exception as e:
+                    self.logger.warning(f"Error extracting field {field_name}: {e}")
+                    item_result[field_name] = default
 
-            # Store collected data
-            result.events.extend(collected_items)
-            self.logger.info(f"Collected {len(collected_items)} items for {instruction.name}")
+            collected_items.append(item_result)
 
-        except Exception as e:
-            result.add_error(f"JSON collection error: {str(e)}")
+        return collected_items
 
     async def _run_simple_scraping(self, result: ScrapingResult):
         """Run simple scraping (static/browser fetching)."""
         try:
             # Fetch initial content
             fetch_result = await self.fetcher.fetch(self.config.meta.start_url)
-            result.metadata['initial_fetch_size'] = len(fetch_result.content)
+            result.metadata['initial_fetch_size'] = fetch_result.content_length or len(fetch_result.content)
 
             # If no instructions, just extract from static content
             if not self.config.instructions:
@@ -413,21 +646,26 @@ class ScraperPipeline:
             # Navigate to start URL
             await self.fetcher.navigate(self.config.meta.start_url)
 
-            # Create instruction context
-            context = InstructionContext(page)
+            # Create instruction context with a bucket per collect instruction
+            context = InstructionContext(
+                page,
+                collection_names=self.instruction_executor.collection_names(self.config.instructions)
+            )
 
             # Execute instructions
-            for instruction in self.config.instructions:
-                success = await self.instruction_executor.execute_instruction(instruction, context)
-                if not success:
-                    self.logger.warning(f"Instruction failed: {instruction.type}")
+            if not await self.instruction_executor.execute_instructions(self.config.instructions, context):
+                self.logger.warning("Instructions stopped early after a failure")
+
+            # Collected items are plain data now; free the page before processing them
+            if any(context.collected_data.values()):
+                await self.fetcher.close_session()
 
             # Process collected data
             for collection_name, collected_items in context.collected_data.items():
                 await self._process_collected_data(collection_name, collected_items, result)
 
-            # If no collections were defined, extract from final page
-            if not context.collected_data:
+            # If nothing was collected, extract from final page
+            if not any(context.collected_data.values()):
                 final_content = await self.fetcher.get_current_content()
                 await self._extract_from_content(final_content.content, result)
 
@@ -462,67 +700,123 @@ class ScraperPipeline:
         """Process collected data from instructions."""
         self.logger.info(f"Processing {len(items)} items from collection: {collection_name}")
 
-        for item in items:
-            # Process each field through configured processors
-            processed_item = await self._process_item_fields(item)
-
-            # Categorize the item based on collection name or content
-            if 'event' in collection_name.lower():
-                result.events.append(processed_item)
-            elif 'market' in collection_name.lower():
-                result.markets.append(processed_item)
-            elif 'selection' in collection_name.lower() or 'odds' in collection_name.lower():
-                result.selections.append(processed_item)
-            else:
-                # Default to events
-                result.events.append(processed_item)
-
-    async def _process_item_fields(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Process item fields through configured processors."""
-        processed_item = {}
+        # Categorize the items based on collection name
+        target = self._collection_target(collection_name, result)
 
-        for field_name, field_value in item.items():
-            # Apply any global processing here if needed
-            processed_item[field_name] = field_value
+        # Browser-collected items are stored as collected
+        target.extend(items)
 
-        return processed_item
+    def _collection_target(self, collection_name: str, result: ScrapingResult) -> List[Dict[str, Any]]:
+        """Result list that items of the named collection belong to."""
+        name = collection_name.lower()
+        if 'event' in name:
+            return result.events
+        elif 'market' in name:
+            return result.markets
+        elif 'selection' in name or 'odds' in name:
+            return result.selections
+        # Default to events
+        return result.events
 
     async def _persist_results(self, result: ScrapingResult):
         """Persist scraping results to database."""
         try:
-            # Get or create bookmaker and category IDs
-            bookmaker_id = self.persister.get_or_create_bookmaker(self.config.database.bookmaker_name)
-            category_id = self.persister.get_or_create_category(self.config.database.category_name)
+            # Get or create bookmaker and category IDs (blocking DB calls run off the event loop)
+            bookmaker_id = await asyncio.to_thread(
+                self.persister.get_or_create_bookmaker, self.config.database.bookmaker_name
+            )
+            category_id = await asyncio.to_thread(
+                self.persister.get_or_create_category, self.config.database.category_name
+            )
 
-            # Save events
-            for event_data in result.events:
-                try:
-                    event_id = self.persister.save_event_data(event_data, bookmaker_id, category_id)
-                    self.logger.debug(f"Saved event with ID: {event_id}")
-                except Exception as e:
-                    result.add_error(f"Failed to save event: {str(e)}")
+            events = self._unique_events(result.events)
+
+            # Save all events in one transaction
+            try:
+                await asyncio.to_thread(
+                    self.persister.save_events_bulk, events, bookmaker_id, category_id
+                )
+                self.logger.debug(f"Saved {len(events)} events in bulk")
+            except Exception as e:
+                # Retry event by event so only the failing events are lost: one transaction
+                # (with a savepoint per event) per chunk, chunks saved in parallel
+                self.logger.warning(f"Bulk save failed, saving events one by one: {e}")
+                chunk_count = self.config.database.max_concurrent_writes
+                chunk_size = -(-len(events) // chunk_count)
+                chunks = [events[start:start + chunk_size] for start in range(0, len(events), chunk_size)]
+
+                chunk_outcomes = await asyncio.gather(
+                    *(
+                        asyncio.to_thread(
+                            self.persister.save_events_individually, chunk, bookmaker_id, category_id
+                        )
+                        for chunk in chunks
+                    ),
+                    return_exceptions=True
+                )
+                for chunk, outcomes in zip(chunks, chunk_outcomes):
+                    if isinstance(outcomes, Exception):
+                        outcomes = [outcomes] * len(chunk)
+                    for outcome in outcomes:
+                        if isinstance(outcome, Exception):
+                            result.add_error(f"Failed to save event: {str(outcome)}")
+                        else:
+                            self.logger.debug(f"Saved event with ID: {outcome}")
 
-            self.logger.info(f"Persisted {len(result.events)} events to database")
+            self.logger.info(f"Persisted {len(events)} events to database")
 
         except Exception as e:
             result.add_error(f"Persistence error: {str(e)}")
 
+    def _unique_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop repeated events (same mapping hash) within this run, keeping the latest copy."""
+        unique = {}
+        for event_data in events:
+            unique[_event_mapping_hash(event_data)] = event_data
+
+        duplicates = len(events) - len(unique)
+        if duplicates:
+            self.logger.info(f"Skipping {duplicates} duplicate events")
+
+        return list(unique.values())
+
 
 class ScraperRunner:
-    """High-level interface for running scrapers."""
+    """
+    High-level interface for running scrapers.
+
+    Meant to be long-lived: pooled connections and the event loop of the sync
+    wrappers are reused across runs until close() is called.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Keep-alive connections shared by the HTTP fetchers of every pipeline this runner starts
+        self.http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        # Event loop of the sync wrappers, created on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def run_scraper(self, config: ScraperConfig) -> ScrapingResult:
         """Run a scraper with the given configuration."""
-        pipeline = ScraperPipeline(config)
-        return await pipeline.run()
+        waited_from = time.monotonic()
+        async with _pipeline_semaphore():
+            wait_seconds = time.monotonic() - waited_from
+            self.logger.debug(f"Waited {wait_seconds:.3f}s for a pipeline slot")
+
+            pipeline = ScraperPipeline(config, http_adapter=self.http_adapter)
+            result = await pipeline.run()
+            result.metadata['pipeline_wait_seconds'] = wait_seconds
+            return result
+
+    def close(self):
+        """Close the pooled HTTP connections and the sync wrappers' event loop."""
+        self.http_adapter.close()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
 
     async def run_scraper_from_file(self, config_path: str) -> ScrapingResult:
         """Run a scraper from a configuration file."""
-        from .config_schema import ConfigLoader
-
         try:
             config = ConfigLoader.load_from_yaml(config_path)
             return await self.run_scraper(config)
@@ -535,8 +829,18 @@ class ScraperRunner:
 
     def run_scraper_sync(self, config: ScraperConfig) -> ScrapingResult:
         """Synchronous wrapper for running scraper."""
-        return asyncio.run(self.run_scraper(config))
+        return self._get_loop().run_until_complete(self.run_scraper(config))
 
     def run_scraper_from_file_sync(self, config_path: str) -> ScrapingResult:
         """Synchronous wrapper for running scraper from file."""
-        return asyncio.run(self.run_scraper_from_file(config_path))
\ No newline at end of file
+        return self._get_loop().run_until_complete(self.run_scraper_from_file(config_path))
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop reused by every sync call of this runner."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+
+class SyncScraperRunner(ScraperRunner):
+    """ScraperRunner for synchronous callers; kept for compatibility, ScraperRunner reuses its loop itself."""
\ No newline at end of file
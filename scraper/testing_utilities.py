@@ -4,20 +4,22 @@ Provides fixtures, mocks, and utilities for testing scraper components.
 """
 
 import asyncio
+import functools
 import json
 import pytest
 import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
 from scraper.config_schema import ScraperConfig, ConfigLoader
 from scraper.fetcher_strategies import FetchResult, FetcherStrategy
-from scraper.instruction_handlers import InstructionContext
-from scraper.scraper_pipeline import ScrapingResult
-from database.config import DatabaseConfig, DatabaseManager
-from database.models import Base
+
+if TYPE_CHECKING:
+    # The pipeline and database layers (SQLAlchemy) are imported where they are used
+    from scraper.scraper_pipeline import ScrapingResult
 
 
 class MockPage:
@@ -52,31 +54,45 @@ class MockPage:
 
     async def wait_for_selector(self, selector: str, **kwargs):
         """Mock waiting for selector."""
-        if selector in self.elements:
-            return self.elements[selector]
-        return MockElement()
+        return self._lookup(selector, multi=False)
 
     async def wait_for_timeout(self, timeout: int):
         """Mock timeout wait."""
-        await asyncio.sleep(0.001)  # Minimal delay for testing
+        return
+
+    async def wait_for_load_state(self, state: str = "load", **kwargs):
+        """Mock load state wait."""
+        pass
+
+    async def wait_for_function(self, expression: str, **kwargs):
+        """Mock function wait."""
+        return True
 
     async def query_selector(self, selector: str):
         """Mock single element selection."""
-        if selector in self.elements:
-            return self.elements[selector]
-        return MockElement()
+        return self._lookup(selector, multi=False)
 
     async def query_selector_all(self, selector: str):
         """Mock multiple element selection."""
-        if selector in self.elements:
-            elements = self.elements[selector]
-            return elements if isinstance(elements, list) else [elements]
-        return [MockElement(), MockElement()]  # Default to 2 elements
+        return self._lookup(selector, multi=True)
+
+    def _lookup(self, selector: str, multi: bool):
+        """Registered element(s) for a selector, or shared default elements."""
+        elements = self.elements.get(selector)
+        if elements is None:
+            return list(_DEFAULT_ELEMENTS) if multi else _DEFAULT_ELEMENT
+        if multi and not isinstance(elements, list):
+            return [elements]
+        return elements
 
     async def select_option(self, selector: str, **kwargs):
         """Mock option selection."""
         pass
 
+    def locator(self, selector: str):
+        """Mock locator creation."""
+        return MockLocator(self, selector)
+
     async def evaluate(self, script: str, *args):
         """Mock JavaScript evaluation."""
         return None
@@ -130,9 +146,59 @@ class MockElement:
         pass
 
 
+# Returned for selectors without registered elements; MockElement is never mutated by its methods
+_DEFAULT_ELEMENT = MockElement()
+_DEFAULT_ELEMENTS = (MockElement(), MockElement())  # Default to 2 elements
+
+
+class MockLocator:
+    """Mock Playwright locator for testing."""
+
+    def __init__(self, page: MockPage, selector: str, index: Optional[int] = None):
+        self.page = page
+        self.selector = selector
+        self.index = index
+
+    @property
+    def first(self):
+        """Mock first-match locator."""
+        return self.nth(0)
+
+    def nth(self, index: int):
+        """Mock nth-match locator."""
+        return MockLocator(self.page, self.selector, index)
+
+    async def _elements(self):
+        elements = await self.page.query_selector_all(self.selector)
+        if self.index is None:
+            return elements
+        return elements[self.index:self.index + 1]
+
+    async def count(self) -> int:
+        """Mock element count."""
+        return len(await self._elements())
+
+    async def is_visible(self) -> bool:
+        """Mock visibility check."""
+        elements = await self._elements()
+        return bool(elements) and await elements[0].is_visible()
+
+    async def is_enabled(self) -> bool:
+        """Mock enabled check."""
+        elements = await self._elements()
+        return bool(elements) and await elements[0].is_enabled()
+
+    async def click(self, **kwargs):
+        """Mock clicking."""
+        self.page.clicked_selectors.append(self.selector)
+
+
 class MockFetcher(FetcherStrategy):
     """Mock fetcher for testing."""
 
+    # fetch() never blocks, so fetch_many can gather over URLs
+    supports_concurrent_fetch = True
+
     def __init__(self, config, content: str = "<html><body></body></html>"):
         super().__init__(config)
         self.content = content
@@ -153,56 +219,95 @@ class MockFetcher(FetcherStrategy):
         pass
 
 
+_BASE_TEST_CONFIG: Dict[str, Any] = {
+    'meta': {
+        'name': 'test_scraper',
+        'description': 'Test scraper configuration',
+        'start_url': 'https://example.com'
+    },
+    'fetcher': {
+        'type': 'static',
+        'timeout_ms': 10000
+    },
+    'database': {
+        'bookmaker_name': 'Test Bookmaker',
+        'category_name': 'Test Category'
+    },
+    'instructions': [
+        {
+            'type': 'collect',
+            'name': 'test_collection',
+            'container_selector': 'body',
+            'item_selector': '.item',
+            'fields': {
+                'name': {
+                    'selector': '.name',
+                    'attribute': 'text'
+                }
+            }
+        }
+    ]
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _base_test_config() -> ScraperConfig:
+    """The base test configuration, validated once."""
+    return ScraperConfig(**_BASE_TEST_CONFIG)
+
+
+def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge overrides into a copy of base; nested dicts merge, other values replace."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 class ScraperTestCase:
     """Base test case for scraper tests."""
 
+    _tmp_path_factory = None
+    _temp_dir: Optional[str] = None
+    _owns_temp_dir = False
+
     def setup_method(self):
         """Setup for each test method."""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = None
+        self._owns_temp_dir = False
         self.test_db_url = "sqlite:///:memory:"
 
     def teardown_method(self):
         """Cleanup after each test method."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if self._owns_temp_dir:
+            import shutil
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
 
-    def create_test_config(self, overrides: Optional[Dict[str, Any]] = None) -> ScraperConfig:
-        """Create a test configuration."""
-        base_config = {
-            'meta': {
-                'name': 'test_scraper',
-                'description': 'Test scraper configuration',
-                'start_url': 'https://example.com'
-            },
-            'fetcher': {
-                'type': 'static',
-                'timeout_ms': 10000
-            },
-            'database': {
-                'url': self.test_db_url,
-                'bookmaker_name': 'Test Bookmaker',
-                'category_name': 'Test Category'
-            },
-            'instructions': [
-                {
-                    'type': 'collect',
-                    'name': 'test_collection',
-                    'container_selector': 'body',
-                    'item_selector': '.item',
-                    'fields': {
-                        'name': {
-                            'selector': '.name',
-                            'attribute': 'text'
-                        }
-                    }
-                }
-            ]
-        }
+    @pytest.fixture(autouse=True)
+    def _use_pytest_tmp_path(self, tmp_path_factory):
+        """Under pytest, create temp dirs through pytest, which also cleans them up."""
+        self._tmp_path_factory = tmp_path_factory
+
+    @property
+    def temp_dir(self) -> str:
+        """Temporary directory of the current test, created on first use."""
+        if self._temp_dir is None:
+            if self._tmp_path_factory is not None:
+                self._temp_dir = str(self._tmp_path_factory.mktemp(self.__class__.__name__))
+            else:
+                self._temp_dir = tempfile.mkdtemp()
+                self._owns_temp_dir = True
+        return self._temp_dir
 
-        if overrides:
-            base_config.update(overrides)
+    def create_test_config(self, overrides: Optional[Dict[str, Any]] = None) -> ScraperConfig:
+        """Create a test configuration, deep-merging overrides into the base one."""
+        if not overrides:
+            return _base_test_config().model_copy(deep=True)
 
-        return ScraperConfig(**base_config)
+        return ScraperConfig(**_deep_merge(_BASE_TEST_CONFIG, overrides))
 
     def create_test_html(self, items: List[Dict[str, str]]) -> str:
         """Create test HTML with specified items."""
@@ -223,9 +328,12 @@ class ScraperTestCase:
         """Save test config to temporary file."""
         import yaml
 
+        # libyaml's C emitter when PyYAML was built with it
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
         config_path = Path(self.temp_dir) / filename
         with open(config_path, 'w') as f:
-            yaml.dump(config_dict, f)
+            yaml.dump(config_dict, f, Dumper=dumper)
 
         return str(config_path)
 
@@ -234,20 +342,20 @@ class DatabaseTestMixin:
     """Mixin for database-related testing."""
 
     @pytest.fixture
-    def test_db(self):
-        """Create test database."""
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-
-        engine = create_engine("sqlite:///:memory:")
-        Base.metadata.create_all(engine)
+    def test_db(self, _test_db_engine):
+        """Create test database session, rolled back after the test (engine fixture in conftest.py)."""
+        from sqlalchemy.orm import Session
 
-        Session = sessionmaker(bind=engine)
-        session = Session()
+        connection = _test_db_engine.connect()
+        transaction = connection.begin()
+        # Commits inside the test only release savepoints of the outer transaction
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
         yield session
 
         session.close()
+        transaction.rollback()
+        connection.close()
 
     def create_test_bookmaker(self, session, name: str = "Test Bookmaker"):
         """Create test bookmaker."""
@@ -314,9 +422,17 @@ def test_config():
     }
 
 
+@pytest.fixture(scope="session")
+def sample_odds_html():
+    """Pytest fixture for odds HTML of DEFAULT_MATCHES, built once per session."""
+    return generate_odds_html(DEFAULT_MATCHES)
+
+
 @pytest.fixture
 def scraping_result():
     """Pytest fixture for scraping result."""
+    from scraper.scraper_pipeline import ScrapingResult
+
     result = ScrapingResult()
     result.events = [
         {'name': 'Test Event 1', 'odds': '2.5'},
@@ -335,33 +451,87 @@ def assert_config_valid(config_dict: Dict[str, Any]):
         pytest.fail(f"Configuration is invalid: {e}")
 
 
-def assert_result_has_data(result: ScrapingResult, min_events: int = 1):
+def assert_result_has_data(result: 'ScrapingResult', min_events: int = 1):
     """Assert that scraping result has minimum data."""
     assert len(result.events) >= min_events, f"Expected at least {min_events} events, got {len(result.events)}"
     assert len(result.errors) == 0, f"Expected no errors, got: {result.errors}"
 
 
-async def run_mock_scraper(config: ScraperConfig, mock_content: str = None) -> ScrapingResult:
+class _NoopPersister:
+    """Stand-in for DatabasePersister that stores nothing."""
+
+    def __init__(self, bookmaker_name: str, category_name: str):
+        self.bookmaker_name = bookmaker_name
+        self.category_name = category_name
+
+    def get_or_create_bookmaker(self, name: str) -> int:
+        """Mock bookmaker lookup."""
+        return 1
+
+    def get_or_create_category(self, name: str) -> int:
+        """Mock category lookup."""
+        return 1
+
+    def save_events_bulk(self, events: List[Dict[str, Any]], bookmaker_id: int, category_id: int) -> List[int]:
+        """Mock bulk save."""
+        return list(range(1, len(events) + 1))
+
+    def save_events_individually(self, events: List[Dict[str, Any]], bookmaker_id: int,
+                                 category_id: int) -> List[Any]:
+        """Mock per-event save in one transaction."""
+        return list(range(1, len(events) + 1))
+
+    def save_event_data(self, event_data: Dict[str, Any], bookmaker_id: int, category_id: int) -> int:
+        """Mock single event save."""
+        return 1
+
+
+async def run_mock_scraper(config: ScraperConfig, mock_content: str = None) -> 'ScrapingResult':
     """Run a scraper with mocked dependencies."""
     from scraper.scraper_pipeline import ScraperPipeline
 
     # Mock the fetcher
-    with patch('scraper.fetcher_strategies.FetcherFactory.create') as mock_factory:
-        mock_fetcher = MockFetcher(config.fetcher, mock_content or "<html><body></body></html>")
-        mock_factory.return_value = mock_fetcher
+    mock_fetcher = MockFetcher(config.fetcher, mock_content or "<html><body></body></html>")
+    create_fetcher = staticmethod(lambda *args, **kwargs: mock_fetcher)
 
+    with patch('scraper.fetcher_strategies.FetcherFactory.create', new=create_fetcher):
         # Mock database operations
-        with patch('scraper.scraper_pipeline.DatabasePersister') as mock_persister:
-            mock_persister_instance = Mock()
-            mock_persister.return_value = mock_persister_instance
-
+        with patch('scraper.scraper_pipeline.DatabasePersister', new=_NoopPersister):
             pipeline = ScraperPipeline(config)
             return await pipeline.run()
 
 
 # Test data generators
+DEFAULT_MATCHES = (
+    {'home': 'Team A', 'away': 'Team B', 'home_odds': '2.5', 'away_odds': '1.8'},
+    {'home': 'Team C', 'away': 'Team D', 'home_odds': '1.9', 'away_odds': '2.1'}
+)
+
+
 def generate_odds_html(matches: List[Dict[str, Any]]) -> str:
     """Generate HTML with betting odds data."""
+    try:
+        # Types are part of the key: 1, 1.0 and True are equal but render differently
+        key = tuple(
+            tuple((name, type(value), value) for name, value in sorted(match.items()))
+            for match in matches
+        )
+        hash(key)
+    except TypeError:
+        # Unhashable values can't be cached
+        return _build_odds_html(matches)
+
+    return _cached_odds_html(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_odds_html(key: tuple) -> str:
+    """Odds HTML for matches given as tuples of sorted (name, type, value) items."""
+    return _build_odds_html([{name: value for name, _, value in items} for items in key])
+
+
+def _build_odds_html(matches: List[Dict[str, Any]]) -> str:
+    """Build HTML with betting odds data."""
     match_html = []
 
     for match in matches:
@@ -406,43 +576,64 @@ class PerformanceTimer:
     """Timer for performance testing."""
 
     def __init__(self):
-        self.start_time = None
-        self.end_time = None
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
 
     def start(self):
         """Start timing."""
-        self.start_time = datetime.utcnow()
+        self.start_ns = time.perf_counter_ns()
 
     def stop(self):
         """Stop timing."""
-        self.end_time = datetime.utcnow()
+        self.end_ns = time.perf_counter_ns()
 
     @property
     def duration(self) -> float:
         """Get duration in seconds."""
-        if not self.start_time or not self.end_time:
+        if self.start_ns is None or self.end_ns is None:
             return 0.0
-        return (self.end_time - self.start_time).total_seconds()
+        return (self.end_ns - self.start_ns) / 1e9
+
 
+def _timed_run(runner, config: ScraperConfig) -> float:
+    """Duration of one scraper run in seconds, inf if it failed."""
+    timer = PerformanceTimer()
+    timer.start()
 
-def benchmark_scraper(config: ScraperConfig, iterations: int = 1) -> Dict[str, float]:
-    """Benchmark scraper performance."""
+    try:
+        runner.run_scraper_sync(config)
+        timer.stop()
+        return timer.duration
+    except Exception:
+        return float('inf')  # Mark failed runs
+
+
+def _timed_run_in_worker(config: ScraperConfig) -> float:
+    """Time one scraper run with a runner of its own (module level so worker processes can pickle it)."""
     from scraper.scraper_pipeline import ScraperRunner
 
-    times = []
     runner = ScraperRunner()
+    try:
+        return _timed_run(runner, config)
+    finally:
+        runner.close()
+
+
+def benchmark_scraper(config: ScraperConfig, iterations: int = 1, workers: int = 1) -> Dict[str, float]:
+    """Benchmark scraper performance; with workers > 1, iterations run in parallel processes."""
+    from scraper.scraper_pipeline import ScraperRunner
 
-    for _ in range(iterations):
-        timer = PerformanceTimer()
-        timer.start()
+    if workers > 1 and iterations > 1:
+        from concurrent.futures import ProcessPoolExecutor
 
+        with ProcessPoolExecutor(max_workers=min(workers, iterations)) as executor:
+            times = list(executor.map(_timed_run_in_worker, [config] * iterations))
+    else:
+        runner = ScraperRunner()
         try:
-            result = runner.run_scraper_sync(config)
-            timer.stop()
-            times.append(timer.duration)
-        except Exception:
-            timer.stop()
-            times.append(float('inf'))  # Mark failed runs
+            times = [_timed_run(runner, config) for _ in range(iterations)]
+        finally:
+            runner.close()
 
     valid_times = [t for t in times if t != float('inf')]
 
@@ -490,6 +681,65 @@ class TestScraperComponents(ScraperTestCase):
         assert 'Item 2' in html
         assert 'class="item"' in html
 
+    def test_same_named_collects_keep_their_own_processors(self):
+        """Test that collects sharing a name each apply their own field processors."""
+        from scraper.scraper_pipeline import ScraperPipeline
+
+        collect = {'type': 'collect', 'name': 'markets', 'container_selector': '$', 'item_selector': '$[*]'}
+        config = self.create_test_config({
+            'fetcher': {'type': 'api'},
+            'instructions': [
+                {**collect, 'fields': {'title': {'selector': '$.title', 'processors': ['uppercase']}}},
+                {**collect, 'fields': {'title': {'selector': '$.title', 'processors': ['lowercase']}}}
+            ]
+        })
+        pipeline = ScraperPipeline(config)
+        upper, lower = config.instructions
+
+        assert pipeline._extract_json_items(upper, [{'title': 'Mixed Case'}]) == [{'title': 'MIXED CASE'}]
+        assert pipeline._extract_json_items(lower, [{'title': 'Mixed Case'}]) == [{'title': 'mixed case'}]
+
+    def test_browser_collected_items_are_stored_as_collected(self):
+        """Test that browser-collected items do not go through the field processors."""
+        from scraper.scraper_pipeline import ScraperPipeline, ScrapingResult
+
+        config = self.create_test_config({
+            'instructions': [
+                {
+                    'type': 'collect',
+                    'name': 'markets',
+                    'container_selector': 'body',
+                    'item_selector': '.item',
+                    'fields': {'title': {'selector': '.title', 'processors': ['uppercase']}}
+                }
+            ]
+        })
+        result = ScrapingResult()
+
+        asyncio.run(ScraperPipeline(config)._process_collected_data('markets', [{'title': 'Mixed Case'}], result))
+
+        assert result.markets == [{'title': 'Mixed Case'}]
+
+
+class TestDatabaseIsolation(DatabaseTestMixin):
+    """Rows committed through test_db must not leak into later tests."""
+
+    def _assert_starts_empty_and_commits(self, session):
+        """Check the bookmakers table is empty, then commit a row and see it."""
+        from database.models import Bookmaker
+
+        assert session.query(Bookmaker).count() == 0
+        self.create_test_bookmaker(session, "Isolation Bookmaker")
+        assert session.query(Bookmaker).filter_by(name="Isolation Bookmaker").count() == 1
+
+    def test_first_session_commits(self, test_db):
+        """Test that a committed row is visible inside the test."""
+        self._assert_starts_empty_and_commits(test_db)
+
+    def test_second_session_starts_empty(self, test_db):
+        """Test that the previous test's committed row was rolled back."""
+        self._assert_starts_empty_and_commits(test_db)
+
 
 # Integration test example
 @pytest.mark.asyncio
@@ -518,11 +768,7 @@ async def test_full_scraper_pipeline():
         })
 
         # Generate test HTML
-        matches = [
-            {'home': 'Team A', 'away': 'Team B', 'home_odds': '2.5', 'away_odds': '1.8'},
-            {'home': 'Team C', 'away': 'Team D', 'home_odds': '1.9', 'away_odds': '2.1'}
-        ]
-        test_html = generate_odds_html(matches)
+        test_html = generate_odds_html(DEFAULT_MATCHES)
 
         # Run scraper
         result = await run_mock_scraper(config, test_html)
@@ -534,6 +780,51 @@ async def test_full_scraper_pipeline():
         test_case.teardown_method()
 
 
+@pytest.mark.asyncio
+async def test_api_pipeline_fetches_all_start_urls():
+    """Test that an API config with start_urls collects items from every URL."""
+    from scraper.fetcher_strategies import APIFetcher
+    from scraper.scraper_pipeline import ScraperPipeline
+
+    responses = {
+        'https://api.example.com/markets?page=1': '[{"id": "1"}, {"id": "2"}]',
+        'https://api.example.com/markets?page=2': '[{"id": "3"}]'
+    }
+
+    async def fetch(self, url: str, **kwargs) -> FetchResult:
+        return FetchResult(
+            content=responses[url],
+            url=url,
+            status_code=200,
+            headers={'content-type': 'application/json'}
+        )
+
+    config = ScraperTestCase().create_test_config({
+        'meta': {
+            'start_url': 'https://api.example.com/markets?page=1',
+            'start_urls': ['https://api.example.com/markets?page=2']
+        },
+        'fetcher': {'type': 'api'},
+        'instructions': [
+            {
+                'type': 'collect',
+                'name': 'markets',
+                'container_selector': '$',
+                'item_selector': '$[*]',
+                'fields': {'market_id': {'selector': '$.id'}}
+            }
+        ]
+    })
+
+    # Real APIFetcher (so fetch_many comes from FetcherStrategy), without network or database
+    with patch.object(APIFetcher, 'fetch', new=fetch):
+        with patch('scraper.scraper_pipeline.DatabasePersister', new=_NoopPersister):
+            result = await ScraperPipeline(config).run()
+
+    assert result.errors == []
+    assert [event['market_id'] for event in result.events] == ['1', '2', '3']
+
+
 if __name__ == "__main__":
     # Run a simple test
     test_case = ScraperTestCase()